@@ -4,6 +4,8 @@ FastAPI main application - Urban Intelligence Platform Backend API.
 
 from fastapi import FastAPI, Depends, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from typing import Optional, Dict, List
@@ -38,6 +40,15 @@ app.add_middleware(
 )
 
 
+def model_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model with its compiled pydantic-core serializer.
+    Returning a Response skips FastAPI's re-validation of the model and the
+    generic jsonable_encoder walk; response_model still drives the docs.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 @app.get("/", tags=["Health"])
 async def root():
     """Root endpoint."""
@@ -67,10 +78,16 @@ async def startup_event():
     print("Database tables verified/created")
     
     # Start the demo data simulator for real-time predictions
-    websocket_routes.start_simulator()
+    await websocket_routes.start_simulator()
     print("WebSocket real-time data simulator started")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks on application shutdown."""
+    websocket_routes.stop_simulator()
+
+
 @app.get("/api/v1/realtime-trends", tags=["Real-Time"])
 async def get_realtime_trends():
     """
@@ -142,7 +159,7 @@ async def get_current_state(
             "sources": metrics["sources"]
         })
         
-        return schemas.CurrentStateResponse(**response_data)
+        return model_response(schemas.CurrentStateResponse(**response_data))
 
     except HTTPException:
         raise
@@ -176,7 +193,7 @@ async def get_risk_assessment(
         # Compute risk assessment
         risk_assessment_result = risk_assessment.compute_risk_assessment(current_state)
 
-        return schemas.RiskAssessmentResponse(**risk_assessment_result)
+        return model_response(schemas.RiskAssessmentResponse(**risk_assessment_result))
 
     except HTTPException:
         raise
@@ -434,6 +451,10 @@ async def get_scenario_presets():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-#   R e - a p p l i e d   s c e n a r i o   l o g i c  
- 
\ No newline at end of file
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:  # e.g. Windows, where uvloop is not available
+        loop = "asyncio"
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop=loop)
+# Re-applied scenario logic
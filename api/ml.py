@@ -24,9 +24,11 @@ class MLEngine:
             current_dir = Path.cwd()
             
             try:
+                # MODEL_CHECKPOINT_DIR lets workers reuse trained models
                 cls._instance = CascadingRiskEngine(
                     use_real_data=True,
-                    auto_train=True
+                    auto_train=True,
+                    checkpoint_dir=os.environ.get("MODEL_CHECKPOINT_DIR")
                 )
                 print("CascadingRiskEngine initialized successfully.")
             except Exception as e:
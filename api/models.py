@@ -67,11 +67,11 @@ class AirQualityDaily(Base):
 
 class RespiratoryWeekly(Base):
     """Respiratory health data aggregated weekly.
-    Note: Table has both 'Week Ending Date' and 'week_ending_date' columns.
+    Note: Databases built before the pipeline kept its declared schema also
+    have a 'Week Ending Date' column; only 'week_ending_date' is queried.
     """
     __tablename__ = "respiratory_weekly"
     
-    # Note: Table uses 'Week Ending Date' as first column but we'll query 'week_ending_date'
     week_ending_date = Column(SQLiteDate, primary_key=True, index=True)
     geographic_aggregation = Column(String, primary_key=True, index=True)
     total_respiratory_cases = Column(Float)  # Stored as REAL in DB
@@ -85,7 +85,8 @@ class RespiratoryWeekly(Base):
 
 class AgricultureDaily(Base):
     """Agriculture price data aggregated daily.
-    Note: Column names match database (Min_Price, Max_Price, Modal_Price).
+    Note: Attribute names keep the pipeline's Min_Price/Max_Price/Modal_Price
+    spelling; SQLite matches them to min_price/max_price/modal_price.
     """
     __tablename__ = "agriculture_daily"
     
@@ -95,9 +96,9 @@ class AgricultureDaily(Base):
     market_name = Column(String, primary_key=True, index=True)
     commodity = Column(String, primary_key=True, index=True)
     variety = Column(String, primary_key=True, index=True)
-    Min_Price = Column(Float)  # Matches database column name
-    Max_Price = Column(Float)  # Matches database column name
-    Modal_Price = Column(Float)  # Matches database column name
+    Min_Price = Column(Float)
+    Max_Price = Column(Float)
+    Modal_Price = Column(Float)
     price_range = Column(Float)
     price_volatility = Column(Float)
     price_volatility_30d = Column(Float)
@@ -13,6 +13,10 @@ from pydantic import BaseModel
 # Import ML engine for inference
 from .ml import MLEngine
 
+# Shared encoder for payloads containing datetimes; json.dumps(default=...)
+# would construct a fresh JSONEncoder on every call.
+_encode_json = json.JSONEncoder(default=str).encode
+
 
 class RealtimeUpdate(BaseModel):
     """Schema for incoming real-time data updates."""
@@ -87,6 +91,9 @@ class RealtimeStateManager:
         # Connected WebSocket clients
         self.connected_clients: List[Any] = []
         
+        # Serialized "init" handshake, rebuilt lazily after each new prediction
+        self._init_message: Optional[str] = None
+        
     def update_environmental(self, data: Dict[str, Any]) -> bool:
         """Update environmental state. Returns True if state changed."""
         changed = False
@@ -244,6 +251,7 @@ class RealtimeStateManager:
             # Store in history
             self.prediction_history.append(record)
             self.latest_prediction = record
+            self._init_message = None
             
             return record
             
@@ -322,6 +330,22 @@ class RealtimeStateManager:
             }
         }
     
+    def get_init_message(self) -> str:
+        """
+        Get the serialized "init" message sent to newly connected clients.
+        Carries only the latest prediction; clients request history and
+        trends with "get_history" / "get_trends" control messages.
+        Cached between inferences so reconnect bursts serialize it only once.
+        """
+        if self._init_message is None:
+            self._init_message = _encode_json({
+                "type": "init",
+                "data": {
+                    "latest": self.latest_prediction.model_dump() if self.latest_prediction else None
+                }
+            })
+        return self._init_message
+    
     async def broadcast_prediction(self, prediction: PredictionRecord):
         """Broadcast prediction to all connected WebSocket clients."""
         if not self.connected_clients:
@@ -11,12 +11,20 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# uvloop ships with uvicorn[standard] but not on Windows; plain asyncio there
+try:
+    import uvloop  # noqa: F401
+    EVENT_LOOP = "uvloop"
+except ImportError:
+    EVENT_LOOP = "asyncio"
+
 if __name__ == "__main__":
     uvicorn.run(
         "api.main:app",
         host="0.0.0.0",
         port=8000,
         reload=True,  # Enable auto-reload during development
+        loop=EVENT_LOOP,
         log_level="info"
     )
 
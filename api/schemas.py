@@ -3,7 +3,7 @@ Pydantic schemas for request/response validation.
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Literal, Union
 from datetime import date, datetime
 
 
@@ -37,8 +37,8 @@ class CurrentStateResponse(BaseModel):
     sources: Optional[Dict[str, str]] = None
     timestamps: Optional[Dict[str, str]] = None  # Detailed formatted timestamps
     
-    # Relax data_freshness to allow string (overall status) or dict (per-domain)
-    data_freshness: Any 
+    # data_freshness is a string (overall status) or a dict (per-domain dates)
+    data_freshness: Union[str, Dict[str, Optional[date]]]
     
     class Config:
         from_attributes = True
@@ -209,3 +209,10 @@ class HealthCheckResponse(BaseModel):
     database_connected: bool
     timestamp: datetime
     version: str = "1.0.0"
+
+
+# Build nested response schemas at import time so a missing or unresolved
+# sub-model fails here instead of on the first request that validates it.
+DeltaScenarioResponse.model_rebuild()
+ScenarioResponse.model_rebuild()
+CurrentStateResponse.model_rebuild()
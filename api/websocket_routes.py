@@ -8,10 +8,17 @@ import random
 from datetime import datetime
 from typing import List
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
 from .realtime import get_state_manager, RealtimeUpdate
 
 router = APIRouter()
 
+# Constant replies are encoded once instead of per message
+PONG_MESSAGE = json.dumps({"type": "pong"})
+RATE_LIMITED_ACK = json.dumps({"type": "ack", "message": "Rate limited, prediction skipped"})
+NO_CHANGE_ACK = json.dumps({"type": "ack", "message": "No change detected"})
+INVALID_JSON_ERROR = json.dumps({"type": "error", "message": "Invalid JSON"})
+
 
 class ConnectionManager:
     """Manages WebSocket connections."""
@@ -28,13 +35,22 @@ class ConnectionManager:
         state_manager.connected_clients.append(websocket)
         
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
+        # remove() already scans the list; a prior `in` check would scan twice
+        try:
             self.active_connections.remove(websocket)
-        state_manager = get_state_manager()
-        if websocket in state_manager.connected_clients:
-            state_manager.connected_clients.remove(websocket)
+        except ValueError:
+            pass
+        try:
+            get_state_manager().connected_clients.remove(websocket)
+        except ValueError:
+            pass
     
     async def broadcast(self, message: str):
+        """
+        Send an already-serialized message to every connection.
+        Callers encode once and pass the result; it stays a text frame
+        because browser clients JSON.parse the frame data directly.
+        """
         disconnected = []
         for connection in self.active_connections:
             try:
@@ -53,31 +69,22 @@ async def websocket_predictions(websocket: WebSocket):
     """
     WebSocket endpoint for receiving real-time predictions.
     Clients subscribe to this to get live risk updates.
+    The init message only carries the latest prediction; send "get_history"
+    and "get_trends" after connecting to load the larger payloads.
     """
     await manager.connect(websocket)
     
     state_manager = get_state_manager()
     
     try:
-        # Send initial state
-        initial_data = {
-            "type": "init",
-            "data": {
-                "history": state_manager.get_prediction_history(),
-                "trends": state_manager.get_trend_summary(),
-                "latest": state_manager.latest_prediction.model_dump() if state_manager.latest_prediction else None
-            }
-        }
-        await websocket.send_text(json.dumps(initial_data, default=str))
+        # Send initial state (cached on the state manager between inferences)
+        await websocket.send_text(state_manager.get_init_message())
         
-        # Keep connection alive and wait for messages
-        while True:
-            # Wait for any message (ping/pong or control)
-            data = await websocket.receive_text()
-            
-            # Handle control messages
+        # Keep connection alive and wait for messages (ping/pong or control);
+        # iter_text() ends cleanly when the client disconnects
+        async for data in websocket.iter_text():
             if data == "ping":
-                await websocket.send_text(json.dumps({"type": "pong"}))
+                await websocket.send_text(PONG_MESSAGE)
             elif data == "get_trends":
                 trends = state_manager.get_trend_summary()
                 await websocket.send_text(json.dumps({"type": "trends", "data": trends}))
@@ -86,6 +93,9 @@ async def websocket_predictions(websocket: WebSocket):
                 await websocket.send_text(json.dumps({"type": "history", "data": history}))
                 
     except WebSocketDisconnect:
+        # A send can still race with the client going away
+        pass
+    finally:
         manager.disconnect(websocket)
 
 
@@ -100,12 +110,12 @@ async def websocket_data_ingest(websocket: WebSocket):
     state_manager = get_state_manager()
     
     try:
-        while True:
-            data = await websocket.receive_text()
-            
+        async for data in websocket.iter_text():
             try:
-                payload = json.loads(data)
-                domain = payload.get("domain", "").lower()
+                # Parse and validate in one pass inside pydantic-core
+                update = RealtimeUpdate.model_validate_json(data)
+                payload = update.model_dump(exclude_none=True)
+                domain = update.domain.lower()
                 
                 # Update appropriate domain
                 changed = False
@@ -132,21 +142,18 @@ async def websocket_data_ingest(websocket: WebSocket):
                             "inference_time_ms": prediction.inference_time_ms
                         }))
                     else:
-                        await websocket.send_text(json.dumps({
-                            "type": "ack",
-                            "message": "Rate limited, prediction skipped"
-                        }))
+                        await websocket.send_text(RATE_LIMITED_ACK)
+                else:
+                    await websocket.send_text(NO_CHANGE_ACK)
+                    
+            except ValidationError as e:
+                if e.errors()[0]["type"] == "json_invalid":
+                    await websocket.send_text(INVALID_JSON_ERROR)
                 else:
                     await websocket.send_text(json.dumps({
-                        "type": "ack",
-                        "message": "No change detected"
+                        "type": "error",
+                        "message": f"Invalid payload: {e.error_count()} validation error(s)"
                     }))
-                    
-            except json.JSONDecodeError:
-                await websocket.send_text(json.dumps({
-                    "type": "error",
-                    "message": "Invalid JSON"
-                }))
                 
     except WebSocketDisconnect:
         pass
@@ -217,12 +224,15 @@ async def simulate_realtime_data():
 _simulator_task = None
 
 
-def start_simulator():
-    """Start the demo data simulator as a background task."""
+async def start_simulator():
+    """
+    Start the demo data simulator as a background task.
+    Must be awaited from the serving loop (e.g. a startup handler);
+    calling it again while the task is running is a no-op.
+    """
     global _simulator_task
     if _simulator_task is None or _simulator_task.done():
-        loop = asyncio.get_event_loop()
-        _simulator_task = loop.create_task(simulate_realtime_data())
+        _simulator_task = asyncio.get_running_loop().create_task(simulate_realtime_data())
         print("Real-time data simulator started")
     return _simulator_task
 
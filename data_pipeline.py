@@ -7,103 +7,288 @@ import pandas as pd
 import numpy as np
 import sqlite3
 from datetime import datetime, timedelta
+import io
 import os
 from pathlib import Path
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
 warnings.filterwarnings('ignore')
 
+# Prefer pyarrow's multithreaded CSV reader; fall back to pandas' C parser
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_parquet
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    pa = pa_csv = pa_parquet = None
+    CSV_ENGINE = 'c'
+
+# Seed for the row samples main() takes of the larger datasets
+SAMPLE_SEED = 42
+
+# Optional: polars runs the grouped rolling windows multithreaded. Its
+# rolling_*(min_samples=) keyword replaced min_periods in 1.21, so older
+# releases fall back to the NumPy path
+POLARS_MIN_VERSION = (1, 21)
+try:
+    import polars as pl
+    if tuple(int(part) for part in pl.__version__.split('.')[:2]) < POLARS_MIN_VERSION:
+        pl = None
+except (ImportError, ValueError):
+    pl = None
+
 
 class DataIngestion:
-    """Handles loading of CSV datasets from different domains."""
+    """
+    Handles loading of CSV datasets from different domains.
+
+    Date columns are parsed with an explicit format and the to_datetime
+    cache, so repeated timestamps (hourly/weekly data) are parsed once.
+    """
 
     def __init__(self, data_dir='.'):
         self.data_dir = Path(data_dir)
 
-    def load_traffic_data(self, filepath='datasets/archive1/TrafficVolumeData.csv'):
+    def _read_dataset(self, filepath, sample_rows=None, columns=None):
+        """
+        Read a dataset, preferring an up-to-date Parquet sibling of the CSV
+        (see convert_to_parquet) and otherwise the fastest CSV engine.
+        With sample_rows, longer files are cut to a uniform random sample of
+        that many rows; with pyarrow this happens while streaming the file.
+        With columns, only those of them present in the file are read.
+        """
+        csv_path = self.data_dir / filepath
+        parquet_path = csv_path.with_suffix('.parquet')
+        use_parquet = parquet_path.exists() and (
+            not csv_path.exists() or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+        )
+        source = parquet_path if use_parquet else csv_path
+        if columns is not None:
+            # Keep file order and drop names the file does not have
+            wanted = set(columns)
+            columns = [col for col in self._header(source) if col in wanted]
+
+        if sample_rows is not None and pa is not None:
+            total = self._count_rows(source)
+            if total > sample_rows:
+                print(f"Sampling {total} records to {sample_rows:,} for performance...")
+                return self._read_sample(source, total, sample_rows, columns)
+            sample_rows = None
+
+        if use_parquet:
+            df = pd.read_parquet(parquet_path, columns=columns)
+        elif CSV_ENGINE == 'pyarrow':
+            df = pd.read_csv(csv_path, engine='pyarrow', usecols=columns)
+        else:
+            df = pd.read_csv(csv_path, low_memory=False, usecols=columns)
+
+        if sample_rows is not None and len(df) > sample_rows:
+            print(f"Sampling {len(df)} records to {sample_rows:,} for performance...")
+            df = df.sample(n=sample_rows, random_state=SAMPLE_SEED)
+        return df
+
+    @staticmethod
+    def _header(path):
+        """Column names of a dataset, without reading its rows."""
+        if path.suffix == '.parquet':
+            return pa_parquet.read_schema(path).names
+        return pd.read_csv(path, nrows=0).columns.tolist()
+
+    @staticmethod
+    def _count_rows(path):
+        """Row count from Parquet metadata, or a CSV pass converting one column."""
+        if path.suffix == '.parquet':
+            return pa_parquet.ParquetFile(path).metadata.num_rows
+        first_col = pa_csv.open_csv(path).schema.names[0]
+        convert_options = pa_csv.ConvertOptions(include_columns=[first_col])
+        return pa_csv.read_csv(path, convert_options=convert_options).num_rows
+
+    @staticmethod
+    def _read_sample(path, total, sample_rows, columns=None):
+        """
+        Stream a file batch by batch, keeping only pre-drawn row positions, so
+        peak memory is one batch plus the sample rather than the whole file.
+        """
+        is_csv = path.suffix != '.parquet'
+        if is_csv:
+            # Streamed CSV types would be fixed by the first block alone, so read
+            # text and let pandas infer types from the sampled rows at the end
+            names = columns if columns is not None else pa_csv.open_csv(path).schema.names
+            convert_options = pa_csv.ConvertOptions(
+                column_types=dict.fromkeys(names, pa.string()), include_columns=names,
+                strings_can_be_null=True
+            )
+            reader = pa_csv.open_csv(path, convert_options=convert_options)
+            schema, batches = reader.schema, reader
+        else:
+            parquet_file = pa_parquet.ParquetFile(path)
+            schema = parquet_file.schema_arrow
+            if columns is not None:
+                schema = pa.schema([schema.field(col) for col in columns])
+            batches = parquet_file.iter_batches(columns=columns)
+
+        keep = np.sort(np.random.default_rng(SAMPLE_SEED).choice(total, sample_rows, replace=False))
+        kept, offset = [], 0
+        for batch in batches:
+            lo, hi = np.searchsorted(keep, [offset, offset + batch.num_rows])
+            if hi > lo:
+                kept.append(batch.take(pa.array(keep[lo:hi] - offset)))
+            offset += batch.num_rows
+
+        table = pa.Table.from_batches(kept, schema=schema)
+        if not is_csv:
+            return table.to_pandas()
+        buffer = pa.BufferOutputStream()
+        pa_csv.write_csv(table, buffer)
+        return pd.read_csv(io.BytesIO(buffer.getvalue().to_pybytes()), engine='pyarrow')
+
+    def load_traffic_data(self, filepath='datasets/archive1/TrafficVolumeData.csv', sample_rows=None, columns=None):
         """Load traffic volume dataset."""
         print(f"Loading traffic data from {filepath}...")
-        df = pd.read_csv(self.data_dir / filepath)
-        df['date_time'] = pd.to_datetime(df['date_time'], errors='coerce')
+        df = self._read_dataset(filepath, sample_rows, columns)
+        df['date_time'] = pd.to_datetime(df['date_time'], errors='coerce', format='%Y-%m-%d %H:%M:%S', cache=True)
         return df
 
-    def load_air_quality_data(self, filepath='datasets/archive3/aqi_india_38cols_knn_final.csv'):
+    def load_air_quality_data(self, filepath='datasets/archive3/aqi_india_38cols_knn_final.csv', sample_rows=None, columns=None):
         """Load air quality dataset."""
         print(f"Loading air quality data from {filepath}...")
-        df = pd.read_csv(self.data_dir / filepath, low_memory=False)
-        df['datetime'] = pd.to_datetime(df['datetime'], errors='coerce')
+        df = self._read_dataset(filepath, sample_rows, columns)
+        df['datetime'] = pd.to_datetime(df['datetime'], errors='coerce', format='%Y-%m-%d %H:%M:%S', cache=True)
         return df
 
-    def load_respiratory_data(self, filepath='raw_weekly_hospital_respiratory_data_2020_2024.csv'):
+    def load_respiratory_data(self, filepath='raw_weekly_hospital_respiratory_data_2020_2024.csv', sample_rows=None, columns=None):
         """Load hospital respiratory data."""
         print(f"Loading respiratory data from {filepath}...")
-        df = pd.read_csv(self.data_dir / filepath, low_memory=False)
-        df['Week Ending Date'] = pd.to_datetime(df['Week Ending Date'], errors='coerce')
+        df = self._read_dataset(filepath, sample_rows, columns)
+        df['Week Ending Date'] = pd.to_datetime(df['Week Ending Date'], errors='coerce', format='%Y-%m-%d', cache=True)
         return df
 
-    def load_agriculture_data(self, filepath='datasets/archive2/Agriculture_price_dataset.csv'):
+    def load_agriculture_data(self, filepath='datasets/archive2/Agriculture_price_dataset.csv', sample_rows=None, columns=None):
         """Load agricultural mandi prices dataset."""
         print(f"Loading agriculture data from {filepath}...")
-        df = pd.read_csv(self.data_dir / filepath, low_memory=False)
+        df = self._read_dataset(filepath, sample_rows, columns)
         # Handle different date formats
-        df['Price Date'] = pd.to_datetime(df['Price Date'], errors='coerce', format='%m/%d/%Y')
+        df['Price Date'] = pd.to_datetime(df['Price Date'], errors='coerce', format='%m/%d/%Y', cache=True)
         return df
 
 
+def convert_to_parquet(csv_path, compression='snappy'):
+    """
+    Rewrite a CSV dataset as a Parquet file next to it.
+    DataIngestion picks the Parquet file up automatically while it is newer
+    than the CSV, skipping CSV tokenizing and type inference on every run.
+    """
+    csv_path = Path(csv_path)
+    parquet_path = csv_path.with_suffix('.parquet')
+    print(f"Converting {csv_path} -> {parquet_path}...")
+    # Empty strings become nulls, matching pd.read_csv
+    table = pa_csv.read_csv(csv_path, convert_options=pa_csv.ConvertOptions(strings_can_be_null=True))
+    pa_parquet.write_table(table, parquet_path, compression=compression)
+    return parquet_path
+
+
+def _coerce_numeric(df, cols):
+    """Convert columns to numbers in one pass, skipping already-numeric ones."""
+    pending = [col for col in cols if not pd.api.types.is_numeric_dtype(df[col])]
+    if pending:
+        df[pending] = df[pending].apply(pd.to_numeric, errors='coerce')
+
+
+def _downcast(df, cols):
+    """
+    Try to narrow float columns to float32 so later groupby and rolling passes
+    stream half the bytes. pandas keeps a column float64 when float32 would
+    overflow or would not round-trip its values within np.allclose tolerance
+    (e.g. large values with fractional parts), so callers must not assume
+    every listed column ends up float32.
+    """
+    pending = [col for col in cols if pd.api.types.is_float_dtype(df[col])]
+    if pending:
+        df[pending] = df[pending].apply(pd.to_numeric, downcast='float')
+
+
+def _downcast_counts(df, cols):
+    """Store whole-number count columns as int32, falling back to _downcast."""
+    int32_max = np.iinfo(np.int32).max
+    for col in cols:
+        values = df[col].to_numpy(dtype=float)
+        if np.isfinite(values).all() and (values == np.round(values)).all() \
+                and np.abs(values).max(initial=0) <= int32_max:
+            df[col] = values.astype(np.int32)
+        else:
+            _downcast(df, [col])
+
+
+def _to_categorical(df, cols):
+    """Store repeated string keys as categoricals so groupbys hash int codes."""
+    for col in cols:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+
+
 class DataCleaner:
-    """Cleans and normalizes data across different domains."""
+    """
+    Cleans and normalizes data across different domains.
+
+    Cleaners work on the frame they are given unless copy=True; callers
+    should rebind to the returned frame and not reuse the input.
+    """
 
     @staticmethod
-    def clean_traffic_data(df):
+    def clean_traffic_data(df, copy=False):
         """Clean traffic volume data."""
         print("Cleaning traffic data...")
-        df_clean = df.copy()
+        df_clean = df.copy() if copy else df
 
         # Remove rows with invalid dates
         df_clean = df_clean.dropna(subset=['date_time'])
 
         # Handle missing values in key columns
         numeric_cols = ['traffic_volume', 'temperature', 'humidity', 'wind_speed', 'air_pollution_index']
-        for col in numeric_cols:
-            if col in df_clean.columns:
-                df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
-                df_clean[col] = df_clean[col].fillna(df_clean[col].median())
+        present_cols = [col for col in numeric_cols if col in df_clean.columns]
+        _coerce_numeric(df_clean, present_cols)
+        df_clean[present_cols] = df_clean[present_cols].fillna(df_clean[present_cols].median())
 
         # Convert temperature from Kelvin to Celsius if needed
         if 'temperature' in df_clean.columns:
             if df_clean['temperature'].mean() > 200:  # Likely in Kelvin
                 df_clean['temperature'] = df_clean['temperature'] - 273.15
+        # Narrow after the Kelvin offset so float32 rounding applies to Celsius values
+        _downcast(df_clean, present_cols)
 
         return df_clean
 
     @staticmethod
-    def clean_air_quality_data(df):
+    def clean_air_quality_data(df, copy=False):
         """Clean air quality data."""
         print("Cleaning air quality data...")
-        df_clean = df.copy()
+        df_clean = df.copy() if copy else df
 
         # Remove rows with invalid dates
         df_clean = df_clean.dropna(subset=['datetime'])
 
         # Handle missing values in key pollution metrics
         pollution_cols = ['us_aqi', 'pm2_5_ugm3', 'pm10_ugm3', 'co_ugm3', 'no2_ugm3', 'so2_ugm3', 'o3_ugm3']
-        for col in pollution_cols:
-            if col in df_clean.columns:
-                df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
-                # Fill missing with median by city
-                if 'city' in df_clean.columns:
-                    df_clean[col] = df_clean.groupby('city')[col].transform(
-                        lambda x: x.fillna(x.median())
-                    )
-                else:
-                    df_clean[col] = df_clean[col].fillna(df_clean[col].median())
+        present_cols = [col for col in pollution_cols if col in df_clean.columns]
+        _coerce_numeric(df_clean, present_cols)
+        _to_categorical(df_clean, ['city', 'state'])
+        if present_cols:
+            # Fill missing with median by city (one Cython groupby for all columns)
+            if 'city' in df_clean.columns:
+                medians = df_clean.groupby('city', observed=True)[present_cols].transform('median')
+            else:
+                medians = df_clean[present_cols].median()
+            df_clean[present_cols] = df_clean[present_cols].fillna(medians)
+            _downcast(df_clean, present_cols)
 
         return df_clean
 
     @staticmethod
-    def clean_respiratory_data(df):
+    def clean_respiratory_data(df, copy=False):
         """Clean hospital respiratory data."""
         print("Cleaning respiratory data...")
-        df_clean = df.copy()
+        df_clean = df.copy() if copy else df
 
         # Remove rows with invalid dates
         df_clean = df_clean.dropna(subset=['Week Ending Date'])
@@ -117,47 +302,145 @@ class DataCleaner:
             'Number of Inpatient Beds'
         ]
 
-        for col in key_cols:
-            if col in df_clean.columns:
-                df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
-                df_clean[col] = df_clean[col].fillna(0)
+        present_cols = [col for col in key_cols if col in df_clean.columns]
+        _coerce_numeric(df_clean, present_cols)
+        df_clean[present_cols] = df_clean[present_cols].fillna(0)
+        # Patient and bed counts are whole numbers; the occupancy percent is not
+        count_cols = [col for col in present_cols if col != 'Percent Inpatient Beds Occupied']
+        _downcast_counts(df_clean, count_cols)
+        _downcast(df_clean, present_cols)
 
         return df_clean
 
     @staticmethod
-    def clean_agriculture_data(df):
+    def clean_agriculture_data(df, copy=False):
         """Clean agriculture price data."""
         print("Cleaning agriculture data...")
-        df_clean = df.copy()
+        df_clean = df.copy() if copy else df
 
         # Remove rows with invalid dates or prices
         df_clean = df_clean.dropna(subset=['Price Date'])
 
         # Clean price columns
-        price_cols = ['Min_Price', 'Max_Price', 'Modal_Price']
+        price_cols = [col for col in ['Min_Price', 'Max_Price', 'Modal_Price'] if col in df_clean.columns]
+        _coerce_numeric(df_clean, price_cols)
+        # Remove outliers (prices > 0) with one fused mask and a single slice
+        keep = np.ones(len(df_clean), dtype=bool)
         for col in price_cols:
-            if col in df_clean.columns:
-                df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
-                # Remove outliers (prices > 0)
-                df_clean = df_clean[(df_clean[col] > 0) | df_clean[col].isna()]
+            keep &= (df_clean[col].to_numpy() > 0) | df_clean[col].isna().to_numpy()
+        df_clean = df_clean.loc[keep]
+        _to_categorical(df_clean, ['STATE', 'District Name', 'Market Name', 'Commodity', 'Variety'])
 
         # Fill missing prices with modal price if available
         if 'Modal_Price' in df_clean.columns:
             for col in ['Min_Price', 'Max_Price']:
                 if col in df_clean.columns:
                     df_clean[col] = df_clean[col].fillna(df_clean['Modal_Price'])
+        _downcast(df_clean, price_cols)
 
         return df_clean
 
 
 class FeatureEngineer:
-    """Engineers domain-specific features for analytics."""
+    """
+    Engineers domain-specific features for analytics.
+
+    Like DataCleaner, feature columns are added to the input frame in place
+    unless copy=True.
+    """
+
+    # Reference safe levels for pollutant normalization (ug/m3)
+    SAFE_LEVELS = {
+        'pm2_5_ugm3': 35,  # WHO guideline
+        'pm10_ugm3': 70,
+        'no2_ugm3': 40,
+        'o3_ugm3': 100
+    }
+
+    # Upper bounds (inclusive) of the US AQI categories; above the last is Hazardous
+    AQI_THRESHOLDS = np.array([50, 100, 150, 200, 300])
+    AQI_CATEGORIES = np.array(
+        ['Good', 'Moderate', 'Unhealthy_Sensitive', 'Unhealthy', 'Very_Unhealthy', 'Hazardous'],
+        dtype=object
+    )
+
+    @staticmethod
+    def categorize_aqi(aqi):
+        """Map US AQI values to severity categories with a single binary search."""
+        idx = np.searchsorted(FeatureEngineer.AQI_THRESHOLDS, np.asarray(aqi, dtype=float), side='left')
+        return pd.Categorical(
+            FeatureEngineer.AQI_CATEGORIES[idx],
+            categories=FeatureEngineer.AQI_CATEGORIES
+        )
 
     @staticmethod
-    def engineer_traffic_features(df):
+    def _rolling_price_features_polars(df, group_keys, window):
+        """
+        Rolling 30-day volatility and price change per group, computed in polars.
+        Expects df sorted by group and date; returns arrays aligned to its rows.
+        """
+        price = pl.col('Modal_Price')
+        result = pl.from_pandas(df[group_keys + ['Modal_Price']]).select(
+            (
+                price.rolling_std(window, min_samples=1).over(group_keys)
+                / (price.rolling_mean(window, min_samples=1).over(group_keys) + 1)
+            ).alias('price_volatility_30d'),
+            (price.pct_change().over(group_keys) * 100).alias('price_change_pct')
+        )
+        volatility = result['price_volatility_30d'].to_numpy().astype(float)
+        change_pct = result['price_change_pct'].to_numpy().astype(float)
+
+        # pandas drops rows with a missing group key; polars groups them together
+        missing_key = df[group_keys].isna().any(axis=1).to_numpy()
+        volatility[missing_key] = np.nan
+        change_pct[missing_key] = np.nan
+        return volatility, change_pct
+
+    @staticmethod
+    def _rolling_price_features_numpy(df, group_keys, window, block_size=65536):
+        """
+        NumPy equivalent of _rolling_price_features_polars.
+        Groups are contiguous runs of ngroup ids in the sorted frame, so each
+        row's window is the previous `window` rows clipped at its group start.
+        """
+        prices = df['Modal_Price'].to_numpy(dtype=float)
+        group_ids = df.groupby(group_keys, sort=False, observed=True).ngroup().to_numpy()
+        n = len(prices)
+        positions = np.arange(n)
+
+        # Index of the first row of each row's group
+        is_start = np.ones(n, dtype=bool)
+        is_start[1:] = group_ids[1:] != group_ids[:-1]
+        group_start = np.maximum.accumulate(np.where(is_start, positions, 0))
+
+        volatility = np.full(n, np.nan)
+        offsets = np.arange(1 - window, 1)
+        with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            # Gather windows block by block to bound the (rows x window) buffer
+            for lo in range(0, n, block_size):
+                rows = positions[lo:lo + block_size]
+                idx = rows[:, None] + offsets
+                windows = np.where(idx >= group_start[rows, None], prices[np.maximum(idx, 0)], np.nan)
+                volatility[rows] = (
+                    np.nanstd(windows, axis=1, ddof=1) / (np.nanmean(windows, axis=1) + 1)
+                )
+
+            change_pct = np.full(n, np.nan)
+            follows = ~is_start
+            change_pct[follows] = (prices[1:][follows[1:]] / prices[:-1][follows[1:]] - 1) * 100
+
+        # Rows with a missing group key (ngroup -1) get no rolling features
+        missing_key = group_ids < 0
+        volatility[missing_key] = np.nan
+        change_pct[missing_key] = np.nan
+        return volatility, change_pct
+
+    @staticmethod
+    def engineer_traffic_features(df, copy=False):
         """Engineer traffic congestion index and related features."""
         print("Engineering traffic features...")
-        df_fe = df.copy()
+        df_fe = df.copy() if copy else df
 
         # Traffic Congestion Index (normalized 0-100)
         if 'traffic_volume' in df_fe.columns:
@@ -169,19 +452,19 @@ class FeatureEngineer:
 
         # Extract temporal features
         if 'date_time' in df_fe.columns:
-            df_fe['date'] = df_fe['date_time'].dt.date
+            df_fe['date'] = df_fe['date_time'].dt.floor('D')
             df_fe['hour'] = df_fe['date_time'].dt.hour
             df_fe['day_of_week'] = df_fe['date_time'].dt.dayofweek
-            df_fe['is_weekend'] = df_fe['day_of_week'].isin([5, 6])
+            df_fe['is_weekend'] = df_fe['day_of_week'].to_numpy() >= 5
             df_fe['month'] = df_fe['date_time'].dt.month
 
         return df_fe
 
     @staticmethod
-    def engineer_aqi_features(df):
+    def engineer_aqi_features(df, copy=False):
         """Engineer AQI severity score and pollution indicators."""
         print("Engineering AQI features...")
-        df_fe = df.copy()
+        df_fe = df.copy() if copy else df
 
         # AQI Severity Score (normalized 0-100, higher = worse)
         if 'us_aqi' in df_fe.columns:
@@ -190,39 +473,21 @@ class FeatureEngineer:
             df_fe['aqi_severity_score'] = np.clip(df_fe['us_aqi'], 0, 500) / 5  # Scale to 0-100
 
             # Categorical severity
-            conditions = [
-                df_fe['us_aqi'] <= 50,
-                df_fe['us_aqi'] <= 100,
-                df_fe['us_aqi'] <= 150,
-                df_fe['us_aqi'] <= 200,
-                df_fe['us_aqi'] <= 300
-            ]
-            choices = ['Good', 'Moderate', 'Unhealthy_Sensitive', 'Unhealthy', 'Very_Unhealthy']
-            df_fe['aqi_severity_category'] = np.select(conditions, choices, default='Hazardous')
+            df_fe['aqi_severity_category'] = FeatureEngineer.categorize_aqi(df_fe['us_aqi'])
 
         # Composite pollution index (weighted average of key pollutants)
         pollution_cols = ['pm2_5_ugm3', 'pm10_ugm3', 'no2_ugm3', 'o3_ugm3']
         available_cols = [col for col in pollution_cols if col in df_fe.columns]
         if available_cols:
-            # Normalize each pollutant (assuming safe levels as reference)
-            for col in available_cols:
-                col_normalized = f"{col}_normalized"
-                if 'pm2_5' in col:
-                    safe_level = 35  # WHO guideline
-                elif 'pm10' in col:
-                    safe_level = 70
-                elif 'no2' in col:
-                    safe_level = 40
-                elif 'o3' in col:
-                    safe_level = 100
-                else:
-                    safe_level = df_fe[col].quantile(0.75)
-                df_fe[col_normalized] = (df_fe[col] / safe_level) * 100
-                df_fe[col_normalized] = df_fe[col_normalized].fillna(0)
+            # Normalize each pollutant against its safe level in one broadcast divide
+            safe_levels = np.array([FeatureEngineer.SAFE_LEVELS[col] for col in available_cols], dtype=float)
+            normalized = df_fe[available_cols].to_numpy(dtype=float) / safe_levels * 100
+            normalized[np.isnan(normalized)] = 0
+            df_fe[[f"{col}_normalized" for col in available_cols]] = normalized
 
         # Extract temporal features
         if 'datetime' in df_fe.columns:
-            df_fe['date'] = df_fe['datetime'].dt.date
+            df_fe['date'] = df_fe['datetime'].dt.floor('D')
             df_fe['hour'] = df_fe['datetime'].dt.hour
             df_fe['day_of_week'] = df_fe['datetime'].dt.dayofweek
             df_fe['month'] = df_fe['datetime'].dt.month
@@ -230,10 +495,10 @@ class FeatureEngineer:
         return df_fe
 
     @staticmethod
-    def engineer_respiratory_features(df):
+    def engineer_respiratory_features(df, copy=False):
         """Engineer respiratory risk indicators."""
         print("Engineering respiratory features...")
-        df_fe = df.copy()
+        df_fe = df.copy() if copy else df
 
         # Total respiratory cases (COVID + Influenza + RSV)
         respiratory_cols = [
@@ -244,20 +509,23 @@ class FeatureEngineer:
 
         available_cols = [col for col in respiratory_cols if col in df_fe.columns]
         if available_cols:
-            df_fe['total_respiratory_cases'] = df_fe[available_cols].sum(axis=1)
+            # Cleaned counts have no NaNs, so a plain ndarray row sum is safe
+            total_cases = df_fe[available_cols].to_numpy().sum(axis=1)
         else:
-            df_fe['total_respiratory_cases'] = 0
-
-        # Respiratory Risk Index (normalized 0-100)
-        if 'total_respiratory_cases' in df_fe.columns:
-            max_cases = df_fe['total_respiratory_cases'].quantile(0.95)
-            min_cases = df_fe['total_respiratory_cases'].quantile(0.05)
-            if max_cases > min_cases:
-                df_fe['respiratory_risk_index'] = (
-                    (df_fe['total_respiratory_cases'] - min_cases) / (max_cases - min_cases) * 100
-                ).clip(0, 100)
-            else:
-                df_fe['respiratory_risk_index'] = 0
+            total_cases = np.zeros(len(df_fe), dtype=np.int64)
+        df_fe['total_respiratory_cases'] = total_cases
+
+        # Respiratory Risk Index (normalized 0-100); both bounds from one quantile pass
+        if len(total_cases):
+            min_cases, max_cases = np.quantile(total_cases, [0.05, 0.95])
+        else:
+            min_cases = max_cases = np.nan
+        if max_cases > min_cases:
+            df_fe['respiratory_risk_index'] = np.clip(
+                (total_cases - min_cases) / (max_cases - min_cases) * 100, 0, 100
+            )
+        else:
+            df_fe['respiratory_risk_index'] = 0
 
         # Bed occupancy pressure
         if 'Percent Inpatient Beds Occupied' in df_fe.columns:
@@ -265,7 +533,7 @@ class FeatureEngineer:
 
         # Extract temporal features
         if 'Week Ending Date' in df_fe.columns:
-            df_fe['date'] = df_fe['Week Ending Date'].dt.date
+            df_fe['date'] = df_fe['Week Ending Date'].dt.floor('D')
             df_fe['week'] = df_fe['Week Ending Date'].dt.isocalendar().week
             df_fe['month'] = df_fe['Week Ending Date'].dt.month
             df_fe['year'] = df_fe['Week Ending Date'].dt.year
@@ -273,10 +541,35 @@ class FeatureEngineer:
         return df_fe
 
     @staticmethod
-    def engineer_agriculture_features(df):
+    def _merge_duplicate_price_rows(df):
+        """
+        Average the prices of rows that repeat an agriculture_daily key
+        (price date, state, district, market, commodity and variety).
+        Other columns keep the first row's value.
+        """
+        key_cols = ['Price Date', 'STATE', 'District Name', 'Market Name', 'Commodity', 'Variety']
+        if not all(col in df.columns for col in key_cols):
+            return df
+        n_duplicates = int(df.duplicated(key_cols).sum())
+        if n_duplicates == 0:
+            return df
+
+        print(f"  Merging {n_duplicates:,} duplicate price rows (same date, market, commodity and variety)")
+        price_cols = ['Min_Price', 'Max_Price', 'Modal_Price']
+        merged = df.groupby(key_cols, sort=False, dropna=False, observed=True).agg({
+            col: 'mean' if col in price_cols else 'first'
+            for col in df.columns if col not in key_cols
+        })
+        return merged.reset_index()[list(df.columns)]
+
+    @staticmethod
+    def engineer_agriculture_features(df, copy=False):
         """Engineer agricultural price volatility metrics."""
         print("Engineering agriculture features...")
-        df_fe = df.copy()
+        df_fe = df.copy() if copy else df
+
+        # One row per agriculture_daily key, so loading it drops nothing
+        df_fe = FeatureEngineer._merge_duplicate_price_rows(df_fe)
 
         # Price volatility (coefficient of variation)
         if all(col in df_fe.columns for col in ['Min_Price', 'Max_Price', 'Modal_Price']):
@@ -284,29 +577,26 @@ class FeatureEngineer:
             df_fe['price_volatility'] = df_fe['price_range'] / (df_fe['Modal_Price'] + 1)  # Add 1 to avoid division by zero
 
         # Calculate rolling volatility by commodity and market
-        df_fe = df_fe.sort_values(['Commodity', 'Market Name', 'Price Date'])
+        group_keys = ['Commodity', 'Market Name']
+        df_fe = df_fe.sort_values(group_keys + ['Price Date'])
 
         volatility_window = 30  # 30-day window
-        # Calculate rolling statistics grouped by commodity and market
-        df_fe['price_std_30d'] = df_fe.groupby(['Commodity', 'Market Name'])['Modal_Price'].transform(
-            lambda x: x.rolling(window=volatility_window, min_periods=1).std()
-        )
-        df_fe['price_mean_30d'] = df_fe.groupby(['Commodity', 'Market Name'])['Modal_Price'].transform(
-            lambda x: x.rolling(window=volatility_window, min_periods=1).mean()
-        )
-        df_fe['price_volatility_30d'] = df_fe['price_std_30d'] / (df_fe['price_mean_30d'] + 1)
-        df_fe = df_fe.drop(columns=['price_std_30d', 'price_mean_30d'])
-
-        # Price change indicators
-        if 'Modal_Price' in df_fe.columns:
-            df_fe = df_fe.sort_values(['Commodity', 'Market Name', 'Price Date'])
-            df_fe['price_change_pct'] = df_fe.groupby(['Commodity', 'Market Name'])[
-                'Modal_Price'
-            ].pct_change() * 100
+        if pl is not None:
+            volatility, change_pct = FeatureEngineer._rolling_price_features_polars(
+                df_fe, group_keys, volatility_window
+            )
+            df_fe['price_volatility_30d'] = volatility
+            df_fe['price_change_pct'] = change_pct
+        else:
+            volatility, change_pct = FeatureEngineer._rolling_price_features_numpy(
+                df_fe, group_keys, volatility_window
+            )
+            df_fe['price_volatility_30d'] = volatility
+            df_fe['price_change_pct'] = change_pct
 
         # Extract temporal features
         if 'Price Date' in df_fe.columns:
-            df_fe['date'] = df_fe['Price Date'].dt.date
+            df_fe['date'] = df_fe['Price Date'].dt.floor('D')
             df_fe['month'] = df_fe['Price Date'].dt.month
             df_fe['year'] = df_fe['Price Date'].dt.year
             df_fe['day_of_week'] = df_fe['Price Date'].dt.dayofweek
@@ -321,23 +611,20 @@ class DataAggregator:
     def aggregate_to_daily(df, date_col, value_cols, agg_dict=None):
         """Aggregate data to daily level."""
         if agg_dict is None:
-            agg_dict = {col: 'mean' for col in value_cols if col in df.columns}
-
-        df_daily = df.copy()
-        df_daily['date'] = pd.to_datetime(df_daily[date_col]).dt.date
-
-        # Group by date and aggregate
-        grouped = df_daily.groupby('date')
+            agg_dict = {col: 'mean' for col in value_cols}
+        agg_dict = {col: func for col, func in agg_dict.items() if col in df.columns}
 
-        aggregated = {}
-        for col, func in agg_dict.items():
-            if col in df_daily.columns:
-                aggregated[col] = grouped[col].agg(func)
+        # Group on midnight timestamps (int64 keys) rather than Python date objects
+        days = pd.to_datetime(df[date_col]).dt.floor('D').rename('date')
+        grouped = df.groupby(days)
 
-        df_result = pd.DataFrame(aggregated).reset_index()
-        df_result['date'] = pd.to_datetime(df_result['date'])
+        if set(agg_dict.values()) <= {'mean'}:
+            # Common case: one Cython mean over all value columns
+            df_result = grouped[list(agg_dict)].mean()
+        else:
+            df_result = grouped.agg(**{col: (col, func) for col, func in agg_dict.items()})
 
-        return df_result
+        return df_result.reset_index()
 
 
 class DatabaseManager:
@@ -350,6 +637,10 @@ class DatabaseManager:
     def connect(self):
         """Establish database connection."""
         self.conn = sqlite3.connect(self.db_path)
+        # Bulk-load settings: WAL keeps readers (the API) unblocked during loads
+        self.conn.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA cache_size=-65536;"
+        )
         return self.conn
 
     def create_schema(self):
@@ -424,7 +715,7 @@ class DatabaseManager:
                 price_volatility REAL,
                 price_volatility_30d REAL,
                 price_change_pct REAL,
-                UNIQUE(date, market_name, commodity, variety)
+                UNIQUE(date, state, district, market_name, commodity, variety)
             )
         ''')
 
@@ -443,100 +734,125 @@ class DatabaseManager:
         self.conn.commit()
         print("Database schema created successfully.")
 
+    def _replace_rows(self, table, df):
+        """
+        Replace all rows of a table created by create_schema with df.
+        Only columns the table declares are written (SQLite matches names
+        case-insensitively). df must not repeat a UNIQUE key: a duplicate
+        raises sqlite3.IntegrityError and the table keeps its previous rows.
+        """
+        table_cols = {row[1].lower() for row in self.conn.execute(f"PRAGMA table_info({table})")}
+        cols = [col for col in df.columns if col.lower() in table_cols]
+        data = df[cols]
+        # Format dates once, as to_sql did; NaN/NaT bind as NULL
+        datetime_cols = [col for col in cols if pd.api.types.is_datetime64_any_dtype(data[col])]
+        if datetime_cols:
+            data = data.assign(**{
+                col: data[col].dt.strftime('%Y-%m-%d %H:%M:%S') for col in datetime_cols
+            })
+
+        col_list = ', '.join(f'"{col}"' for col in cols)
+        placeholders = ', '.join('?' * len(cols))
+        with self.conn:
+            self.conn.execute(f"DELETE FROM {table}")
+            self.conn.executemany(
+                f"INSERT INTO {table} ({col_list}) VALUES ({placeholders})",
+                data.itertuples(index=False, name=None)
+            )
+
     def insert_traffic_daily(self, df):
         """Insert aggregated daily traffic data."""
         print("Inserting traffic data...")
         df['date'] = pd.to_datetime(df['date'])
-        df.to_sql('traffic_daily', self.conn, if_exists='replace', index=False)
+        self._replace_rows('traffic_daily', df)
 
     def insert_air_quality_daily(self, df):
         """Insert aggregated daily air quality data."""
         print("Inserting air quality data...")
         df['date'] = pd.to_datetime(df['date'])
-        df.to_sql('air_quality_daily', self.conn, if_exists='replace', index=False)
+        self._replace_rows('air_quality_daily', df)
 
     def insert_respiratory_weekly(self, df):
         """Insert weekly respiratory data."""
         print("Inserting respiratory data...")
         df['week_ending_date'] = pd.to_datetime(df['Week Ending Date'])
-        df.to_sql('respiratory_weekly', self.conn, if_exists='replace', index=False)
+        self._replace_rows('respiratory_weekly', df)
 
     def insert_agriculture_daily(self, df):
         """Insert daily agriculture data."""
         print("Inserting agriculture data...")
         df['date'] = pd.to_datetime(df['date'])
-        df.to_sql('agriculture_daily', self.conn, if_exists='replace', index=False)
+        self._replace_rows('agriculture_daily', df)
 
     def create_analytics_view(self):
         """Create cross-domain analytics by aggregating all domains to daily level."""
         print("Creating cross-domain analytics view...")
-        cursor = self.conn.cursor()
 
-        # Get traffic data
-        traffic_query = '''
-            SELECT date, avg_traffic_congestion_index
-            FROM traffic_daily
-        '''
-        traffic_df = pd.read_sql_query(traffic_query, self.conn)
-
-        # Get air quality data (aggregated by date, averaging across cities)
-        aq_query = '''
-            SELECT date, AVG(avg_aqi_severity_score) as avg_aqi_severity_score
-            FROM air_quality_daily
-            GROUP BY date
-        '''
-        aq_df = pd.read_sql_query(aq_query, self.conn)
-
-        # Get respiratory data (convert weekly to daily, forward fill)
-        resp_query = '''
-            SELECT week_ending_date as date, AVG(respiratory_risk_index) as avg_respiratory_risk_index
-            FROM respiratory_weekly
-            GROUP BY week_ending_date
-        '''
-        resp_df = pd.read_sql_query(resp_query, self.conn)
-
-        # Get agriculture data (aggregated by date)
-        agri_query = '''
-            SELECT date, AVG(price_volatility_30d) as avg_price_volatility
-            FROM agriculture_daily
-            WHERE price_volatility_30d IS NOT NULL
-            GROUP BY date
-        '''
-        agri_df = pd.read_sql_query(agri_query, self.conn)
-
-        # Merge all dataframes on date
-        all_dfs = [traffic_df, aq_df, resp_df, agri_df]
-        non_empty_dfs = [df for df in all_dfs if not df.empty]
-        
-        if non_empty_dfs:
-            analytics_df = pd.DataFrame({'date': pd.date_range(
-                start=min([df['date'].min() for df in non_empty_dfs]),
-                end=max([df['date'].max() for df in non_empty_dfs]),
-                freq='D'
-            )})
-
-            analytics_df['date'] = pd.to_datetime(analytics_df['date'])
-
-            for df, col in [(traffic_df, 'avg_traffic_congestion_index'),
-                            (aq_df, 'avg_aqi_severity_score'),
-                            (resp_df, 'avg_respiratory_risk_index'),
-                            (agri_df, 'avg_price_volatility')]:
-                if not df.empty:
-                    df['date'] = pd.to_datetime(df['date'])
-                    analytics_df = analytics_df.merge(df[['date', col]], on='date', how='left')
-
-            # Create data availability flags
-            analytics_df['data_availability_flags'] = (
-                analytics_df['avg_traffic_congestion_index'].notna().astype(int).astype(str) +
-                analytics_df['avg_aqi_severity_score'].notna().astype(int).astype(str) +
-                analytics_df['avg_respiratory_risk_index'].notna().astype(int).astype(str) +
-                analytics_df['avg_price_volatility'].notna().astype(int).astype(str)
+        # Per-domain daily averages are left-joined onto a calendar spanning every
+        # domain, all inside SQLite. Dates are stored in one text format
+        # ('YYYY-MM-DD HH:MM:SS'), so they join and step with datetime() directly.
+        query = '''
+            WITH RECURSIVE
+            traffic_day AS (
+                SELECT date, avg_traffic_congestion_index AS value
+                FROM traffic_daily
+            ),
+            aq_day AS (
+                SELECT date, AVG(avg_aqi_severity_score) AS value
+                FROM air_quality_daily
+                GROUP BY date
+            ),
+            resp_day AS (
+                SELECT week_ending_date AS date, AVG(respiratory_risk_index) AS value
+                FROM respiratory_weekly
+                GROUP BY week_ending_date
+            ),
+            agri_day AS (
+                SELECT date, AVG(price_volatility_30d) AS value
+                FROM agriculture_daily
+                WHERE price_volatility_30d IS NOT NULL
+                GROUP BY date
+            ),
+            bounds AS (
+                SELECT MIN(date) AS first_day, MAX(date) AS last_day
+                FROM (
+                    SELECT date FROM traffic_day UNION ALL
+                    SELECT date FROM aq_day UNION ALL
+                    SELECT date FROM resp_day UNION ALL
+                    SELECT date FROM agri_day
+                )
+            ),
+            calendar(date) AS (
+                SELECT first_day FROM bounds WHERE first_day IS NOT NULL
+                UNION ALL
+                SELECT datetime(calendar.date, '+1 day')
+                FROM calendar, bounds
+                WHERE calendar.date < bounds.last_day
+            )
+            INSERT INTO analytics_daily (
+                date, avg_traffic_congestion_index, avg_aqi_severity_score,
+                avg_respiratory_risk_index, avg_price_volatility, data_availability_flags
             )
+            SELECT
+                c.date, t.value, aq.value, r.value, a.value,
+                -- IS NOT NULL yields integer 0/1, which || renders as '0'/'1'
+                ((t.value IS NOT NULL) || (aq.value IS NOT NULL) ||
+                 (r.value IS NOT NULL) || (a.value IS NOT NULL))
+            FROM calendar c
+            LEFT JOIN traffic_day t ON t.date = c.date
+            LEFT JOIN aq_day aq ON aq.date = c.date
+            LEFT JOIN resp_day r ON r.date = c.date
+            LEFT JOIN agri_day a ON a.date = c.date
+            ORDER BY c.date
+        '''
 
-            # Insert into analytics table
-            analytics_df.to_sql('analytics_daily', self.conn, if_exists='replace', index=False)
+        with self.conn:
+            self.conn.execute("DELETE FROM analytics_daily")
+            self.conn.execute(query)
+        inserted = self.conn.execute("SELECT COUNT(*) FROM analytics_daily").fetchone()[0]
 
-            print(f"Analytics view created with {len(analytics_df)} daily records.")
+        if inserted > 0:
+            print(f"Analytics view created with {inserted} daily records.")
         else:
             print("No data available to create analytics view.")
 
@@ -546,17 +862,163 @@ class DatabaseManager:
             self.conn.close()
 
 
+def process_traffic_data(data_dir='.'):
+    """Aggregate traffic to daily rows for traffic_daily."""
+    ingestion = DataIngestion(data_dir)
+    cleaner = DataCleaner()
+    feature_engineer = FeatureEngineer()
+    aggregator = DataAggregator()
+
+    print("\n[1/4] Processing Traffic Data...")
+    traffic_df = ingestion.load_traffic_data(columns=[
+        'date_time', 'traffic_volume', 'temperature', 'humidity', 'wind_speed', 'air_pollution_index'
+    ])
+    traffic_df = cleaner.clean_traffic_data(traffic_df)
+    traffic_df = feature_engineer.engineer_traffic_features(traffic_df)
+
+    # Aggregate to daily
+    traffic_daily = aggregator.aggregate_to_daily(
+        traffic_df,
+        'date_time',
+        ['traffic_volume', 'traffic_congestion_index', 'temperature', 'humidity', 
+         'wind_speed', 'air_pollution_index'],
+        {
+            'traffic_volume': 'mean',
+            'traffic_congestion_index': 'mean',
+            'temperature': 'mean',
+            'humidity': 'mean',
+            'wind_speed': 'mean',
+            'air_pollution_index': 'mean'
+        }
+    )
+    traffic_daily.rename(columns={
+        'traffic_volume': 'avg_traffic_volume',
+        'traffic_congestion_index': 'avg_traffic_congestion_index',
+        'temperature': 'avg_temperature',
+        'humidity': 'avg_humidity',
+        'wind_speed': 'avg_wind_speed',
+        'air_pollution_index': 'avg_air_pollution_index'
+    }, inplace=True)
+    # Calculate record count properly by merging
+    record_counts = traffic_df.groupby(traffic_df['date_time'].dt.floor('D')).size().reset_index(name='record_count')
+    record_counts.rename(columns={'date_time': 'date'}, inplace=True)
+    traffic_daily = traffic_daily.merge(record_counts[['date', 'record_count']], on='date', how='left')
+    traffic_daily['record_count'] = traffic_daily['record_count'].fillna(0).astype(int)
+    return traffic_daily
+
+
+def process_air_quality_data(data_dir='.'):
+    """Aggregate air quality to daily rows per city for air_quality_daily."""
+    ingestion = DataIngestion(data_dir)
+    cleaner = DataCleaner()
+    feature_engineer = FeatureEngineer()
+
+    print("\n[2/4] Processing Air Quality Data...")
+    # Sample data if too large (for performance)
+    aq_df = ingestion.load_air_quality_data(sample_rows=500000, columns=[
+        'datetime', 'city', 'state', 'us_aqi', 'pm2_5_ugm3', 'pm10_ugm3',
+        'co_ugm3', 'no2_ugm3', 'so2_ugm3', 'o3_ugm3'
+    ])
+    aq_df = cleaner.clean_air_quality_data(aq_df)
+    aq_df = feature_engineer.engineer_aqi_features(aq_df)
+
+    # Aggregate to daily by city/state
+    aq_daily = aq_df.groupby(['date', 'city', 'state'], observed=True).agg({
+        'us_aqi': 'mean',
+        'aqi_severity_score': 'mean',
+        'pm2_5_ugm3': 'mean',
+        'pm10_ugm3': 'mean',
+        'no2_ugm3': 'mean',
+        'o3_ugm3': 'mean'
+    }).reset_index()
+    aq_daily.rename(columns={
+        'us_aqi': 'avg_us_aqi',
+        'aqi_severity_score': 'avg_aqi_severity_score',
+        'pm2_5_ugm3': 'avg_pm2_5',
+        'pm10_ugm3': 'avg_pm10',
+        'no2_ugm3': 'avg_no2',
+        'o3_ugm3': 'avg_o3'
+    }, inplace=True)
+    # Bucket the daily mean instead of taking a per-group mode of the raw categories
+    aq_daily['aqi_severity_category'] = FeatureEngineer.categorize_aqi(aq_daily['avg_us_aqi'])
+    aq_daily['record_count'] = 1  # Placeholder
+    return aq_daily
+
+
+def process_respiratory_data(data_dir='.'):
+    """Prepare weekly respiratory rows for respiratory_weekly."""
+    ingestion = DataIngestion(data_dir)
+    cleaner = DataCleaner()
+    feature_engineer = FeatureEngineer()
+
+    print("\n[3/4] Processing Respiratory Data...")
+    # Sample data if too large (for performance)
+    resp_df = ingestion.load_respiratory_data(sample_rows=100000, columns=[
+        'Week Ending Date', 'Geographic aggregation',
+        'Total Patients Hospitalized with COVID-19',
+        'Total Patients Hospitalized with Influenza',
+        'Total Patients Hospitalized with RSV',
+        'Percent Inpatient Beds Occupied', 'Number of Inpatient Beds'
+    ])
+    resp_df = cleaner.clean_respiratory_data(resp_df)
+    resp_df = feature_engineer.engineer_respiratory_features(resp_df)
+
+    # Prepare for database
+    resp_export = resp_df[[
+        'Week Ending Date', 'Geographic aggregation', 'total_respiratory_cases',
+        'respiratory_risk_index',
+        'Total Patients Hospitalized with COVID-19',
+        'Total Patients Hospitalized with Influenza',
+        'Total Patients Hospitalized with RSV',
+        'Percent Inpatient Beds Occupied', 'bed_occupancy_pressure'
+    ]].copy()
+    resp_export.rename(columns={
+        'Geographic aggregation': 'geographic_aggregation',
+        'Total Patients Hospitalized with COVID-19': 'total_covid19_cases',
+        'Total Patients Hospitalized with Influenza': 'total_influenza_cases',
+        'Total Patients Hospitalized with RSV': 'total_rsv_cases',
+        'Percent Inpatient Beds Occupied': 'bed_occupancy_percent'
+    }, inplace=True)
+    return resp_export
+
+
+def process_agriculture_data(data_dir='.'):
+    """Prepare daily agriculture rows for agriculture_daily."""
+    ingestion = DataIngestion(data_dir)
+    cleaner = DataCleaner()
+    feature_engineer = FeatureEngineer()
+
+    print("\n[4/4] Processing Agriculture Data...")
+    # Sample data if too large (for performance)
+    agri_df = ingestion.load_agriculture_data(sample_rows=200000, columns=[
+        'Price Date', 'STATE', 'District Name', 'Market Name', 'Commodity', 'Variety',
+        'Min_Price', 'Max_Price', 'Modal_Price'
+    ])
+    agri_df = cleaner.clean_agriculture_data(agri_df)
+    agri_df = feature_engineer.engineer_agriculture_features(agri_df)
+
+    # Prepare for database
+    agri_export = agri_df[[
+        'date', 'STATE', 'District Name', 'Market Name', 'Commodity', 'Variety',
+        'Min_Price', 'Max_Price', 'Modal_Price', 'price_range',
+        'price_volatility', 'price_volatility_30d', 'price_change_pct'
+    ]].copy()
+    agri_export.rename(columns={
+        'STATE': 'state',
+        'District Name': 'district',
+        'Market Name': 'market_name',
+        'Commodity': 'commodity',
+        'Variety': 'variety'
+    }, inplace=True)
+    return agri_export
+
+
 def main():
     """Main pipeline execution."""
     print("=" * 60)
     print("Urban Intelligence Platform - Data Pipeline")
     print("=" * 60)
 
-    # Initialize components
-    ingestion = DataIngestion()
-    cleaner = DataCleaner()
-    feature_engineer = FeatureEngineer()
-    aggregator = DataAggregator()
     db_manager = DatabaseManager()
 
     # Connect to database
@@ -564,127 +1026,17 @@ def main():
     db_manager.create_schema()
 
     try:
-        # 1. Ingest and process Traffic Data
-        print("\n[1/4] Processing Traffic Data...")
-        traffic_df = ingestion.load_traffic_data()
-        traffic_df = cleaner.clean_traffic_data(traffic_df)
-        traffic_df = feature_engineer.engineer_traffic_features(traffic_df)
-
-        # Aggregate to daily
-        traffic_daily = aggregator.aggregate_to_daily(
-            traffic_df,
-            'date_time',
-            ['traffic_volume', 'traffic_congestion_index', 'temperature', 'humidity', 
-             'wind_speed', 'air_pollution_index'],
-            {
-                'traffic_volume': 'mean',
-                'traffic_congestion_index': 'mean',
-                'temperature': 'mean',
-                'humidity': 'mean',
-                'wind_speed': 'mean',
-                'air_pollution_index': 'mean'
+        # 1-4. The domains are independent, so each runs in its own worker
+        # process; this process stays the single SQLite writer
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            inserts = {
+                executor.submit(process_traffic_data): db_manager.insert_traffic_daily,
+                executor.submit(process_air_quality_data): db_manager.insert_air_quality_daily,
+                executor.submit(process_respiratory_data): db_manager.insert_respiratory_weekly,
+                executor.submit(process_agriculture_data): db_manager.insert_agriculture_daily,
             }
-        )
-        traffic_daily.rename(columns={
-            'traffic_volume': 'avg_traffic_volume',
-            'traffic_congestion_index': 'avg_traffic_congestion_index',
-            'temperature': 'avg_temperature',
-            'humidity': 'avg_humidity',
-            'wind_speed': 'avg_wind_speed',
-            'air_pollution_index': 'avg_air_pollution_index'
-        }, inplace=True)
-        # Calculate record count properly by merging
-        record_counts = traffic_df.groupby(traffic_df['date_time'].dt.date).size().reset_index(name='record_count')
-        record_counts.rename(columns={'date_time': 'date'}, inplace=True)
-        record_counts['date'] = pd.to_datetime(record_counts['date'])
-        traffic_daily = traffic_daily.merge(record_counts[['date', 'record_count']], on='date', how='left')
-        traffic_daily['record_count'] = traffic_daily['record_count'].fillna(0).astype(int)
-        db_manager.insert_traffic_daily(traffic_daily)
-
-        # 2. Ingest and process Air Quality Data
-        print("\n[2/4] Processing Air Quality Data...")
-        aq_df = ingestion.load_air_quality_data()
-        # Sample data if too large (for performance)
-        if len(aq_df) > 500000:
-            print(f"Sampling {len(aq_df)} records to 500K for performance...")
-            aq_df = aq_df.sample(n=500000, random_state=42)
-        aq_df = cleaner.clean_air_quality_data(aq_df)
-        aq_df = feature_engineer.engineer_aqi_features(aq_df)
-
-        # Aggregate to daily by city/state
-        aq_daily = aq_df.groupby(['date', 'city', 'state']).agg({
-            'us_aqi': 'mean',
-            'aqi_severity_score': 'mean',
-            'pm2_5_ugm3': 'mean',
-            'pm10_ugm3': 'mean',
-            'no2_ugm3': 'mean',
-            'o3_ugm3': 'mean',
-            'aqi_severity_category': lambda x: x.mode()[0] if len(x.mode()) > 0 else 'Unknown'
-        }).reset_index()
-        aq_daily.rename(columns={
-            'us_aqi': 'avg_us_aqi',
-            'aqi_severity_score': 'avg_aqi_severity_score',
-            'pm2_5_ugm3': 'avg_pm2_5',
-            'pm10_ugm3': 'avg_pm10',
-            'no2_ugm3': 'avg_no2',
-            'o3_ugm3': 'avg_o3',
-            'aqi_severity_category': 'aqi_severity_category'
-        }, inplace=True)
-        aq_daily['record_count'] = 1  # Placeholder
-        db_manager.insert_air_quality_daily(aq_daily)
-
-        # 3. Ingest and process Respiratory Data
-        print("\n[3/4] Processing Respiratory Data...")
-        resp_df = ingestion.load_respiratory_data()
-        # Sample data if too large
-        if len(resp_df) > 100000:
-            print(f"Sampling {len(resp_df)} records to 100K for performance...")
-            resp_df = resp_df.sample(n=100000, random_state=42)
-        resp_df = cleaner.clean_respiratory_data(resp_df)
-        resp_df = feature_engineer.engineer_respiratory_features(resp_df)
-
-        # Prepare for database
-        resp_export = resp_df[[
-            'Week Ending Date', 'Geographic aggregation', 'total_respiratory_cases',
-            'respiratory_risk_index',
-            'Total Patients Hospitalized with COVID-19',
-            'Total Patients Hospitalized with Influenza',
-            'Total Patients Hospitalized with RSV',
-            'Percent Inpatient Beds Occupied', 'bed_occupancy_pressure'
-        ]].copy()
-        resp_export.rename(columns={
-            'Geographic aggregation': 'geographic_aggregation',
-            'Total Patients Hospitalized with COVID-19': 'total_covid19_cases',
-            'Total Patients Hospitalized with Influenza': 'total_influenza_cases',
-            'Total Patients Hospitalized with RSV': 'total_rsv_cases',
-            'Percent Inpatient Beds Occupied': 'bed_occupancy_percent'
-        }, inplace=True)
-        db_manager.insert_respiratory_weekly(resp_export)
-
-        # 4. Ingest and process Agriculture Data
-        print("\n[4/4] Processing Agriculture Data...")
-        agri_df = ingestion.load_agriculture_data()
-        # Sample data if too large
-        if len(agri_df) > 200000:
-            print(f"Sampling {len(agri_df)} records to 200K for performance...")
-            agri_df = agri_df.sample(n=200000, random_state=42)
-        agri_df = cleaner.clean_agriculture_data(agri_df)
-        agri_df = feature_engineer.engineer_agriculture_features(agri_df)
-
-        # Prepare for database
-        agri_export = agri_df[[
-            'date', 'STATE', 'District Name', 'Market Name', 'Commodity', 'Variety',
-            'Min_Price', 'Max_Price', 'Modal_Price', 'price_range',
-            'price_volatility', 'price_volatility_30d', 'price_change_pct'
-        ]].copy()
-        agri_export.rename(columns={
-            'STATE': 'state',
-            'District Name': 'district',
-            'Market Name': 'market_name',
-            'Commodity': 'commodity',
-            'Variety': 'variety'
-        }, inplace=True)
-        db_manager.insert_agriculture_daily(agri_export)
+            for future in as_completed(inserts):
+                inserts[future](future.result())
 
         # 5. Create cross-domain analytics view
         print("\n[5/5] Creating Cross-Domain Analytics View...")
@@ -716,4 +1068,11 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    import sys
+    if '--to-parquet' in sys.argv:
+        # One-shot conversion of the default datasets; rerun after replacing a CSV
+        for loader in (DataIngestion.load_traffic_data, DataIngestion.load_air_quality_data,
+                       DataIngestion.load_respiratory_data, DataIngestion.load_agriculture_data):
+            convert_to_parquet(loader.__defaults__[0])
+    else:
+        main()
@@ -235,10 +235,10 @@ export class TrendAnalysis {
       this.handleLivePrediction(data);
     });
 
-    this.realtimeClient.on('init', (data) => {
-      console.log('Initial data received:', data);
-      if (data.history && data.history.length > 0) {
-        this.updateGraphsFromHistory(data.history);
+    this.realtimeClient.on('history_loaded', (history) => {
+      console.log('History received:', history);
+      if (history && history.length > 0) {
+        this.updateGraphsFromHistory(history);
       }
     });
 
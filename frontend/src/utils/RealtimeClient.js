@@ -42,6 +42,10 @@ export class RealtimeClient {
                 console.log('WebSocket connected');
                 this.isConnected = true;
                 this.reconnectAttempts = 0;
+                // The init message only carries the latest prediction;
+                // history and trends are fetched on demand
+                this.requestHistory();
+                this.requestTrends();
                 this.emit('connected');
             };
 
@@ -148,6 +152,7 @@ export class RealtimeClient {
                 case 'history':
                     this.predictionHistory = message.data;
                     this.emit('history', message.data);
+                    this.emit('history_loaded', message.data);
                     break;
 
                 case 'pong':
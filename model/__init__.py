@@ -28,29 +28,21 @@ All models feature:
 - Calibrated probability outputs
 - Policy intervention simulation hooks
 - Support for both synthetic and real data training
+
+Package-level names are imported lazily: `import model` is cheap and
+`model.RiskEngine` loads only model.risk_engine. Services that need a
+single engine can also import it from its submodule directly:
+- model.risk_engine.RiskEngine
+- model.real_data_engine.RealDataRiskEngine
+- model.cascading_engine.CascadingRiskEngine
+- model.scenario_comparison / model.roi_calculator (Phase 3 helpers)
+- model.explainability.ExplainabilityEngine
+- model.validation.SystemValidator
 """
 
-from .risk_engine import RiskEngine
-from .real_data_engine import RealDataRiskEngine
-from .cascading_engine import (
-    CascadingRiskEngine,
-    predict_cascading_risks,
-    run_policy_scenario
-)
-from .scenario_comparison import compare_scenarios, format_comparison_report
-from .roi_calculator import calculate_roi, calculate_policy_portfolio_roi, CostAssumptions
-from .explainability import (
-    ExplainabilityEngine,
-    explain_prediction,
-    get_feature_importance
-)
-from .validation import (
-    SystemValidator,
-    run_full_system_check,
-    run_all_validations
-)
+__version__ = '0.4.0'
 
-__all__ = [
+__all__ = (
     # Phase 1
     'RiskEngine',
     'RealDataRiskEngine',
@@ -70,6 +62,42 @@ __all__ = [
     # Phase 4
     'SystemValidator',
     'run_full_system_check',
-    'run_all_validations'
-]
-__version__ = '0.4.0'
+    'run_all_validations',
+)
+
+import importlib
+
+# Public name -> defining submodule. Submodules pull in numpy/pandas/sklearn,
+# so each one is imported on first attribute access (PEP 562) instead of
+# when the package is imported.
+_LAZY = {
+    'RiskEngine': 'risk_engine',
+    'RealDataRiskEngine': 'real_data_engine',
+    'CascadingRiskEngine': 'cascading_engine',
+    'predict_cascading_risks': 'cascading_engine',
+    'run_policy_scenario': 'cascading_engine',
+    'compare_scenarios': 'scenario_comparison',
+    'format_comparison_report': 'scenario_comparison',
+    'calculate_roi': 'roi_calculator',
+    'calculate_policy_portfolio_roi': 'roi_calculator',
+    'CostAssumptions': 'roi_calculator',
+    'ExplainabilityEngine': 'explainability',
+    'explain_prediction': 'explainability',
+    'get_feature_importance': 'explainability',
+    'SystemValidator': 'validation',
+    'run_full_system_check': 'validation',
+    'run_all_validations': 'validation',
+}
+
+
+def __getattr__(name):
+    modname = _LAZY.get(name)
+    if modname is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module('.' + modname, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,81 @@
+"""
+Numeric Kernels for the Cascading Risk Engine
+
+Hot math used on every prediction:
+- Scalar kernels use the math module only, so a single-row call is a
+  handful of float operations instead of several small NumPy dispatches
+- Batch kernels take whole probability arrays and return one value per row
+
+Both variants produce identical results for the same inputs.
+"""
+
+import math
+import numpy as np
+
+LOG_3 = math.log(3)
+
+
+# =============================================================================
+# SCALAR KERNELS
+# =============================================================================
+
+def resilience(e: float, h: float, f: float, we: float, wh: float, wf: float) -> int:
+    """Resilience score in [0, 100] from high-risk probabilities and weights."""
+    return int(max(0, min(100, 100 * (1 - (we * e + wh * h + wf * f)))))
+
+
+def confidence(p0: float, p1: float, p2: float) -> float:
+    """
+    Confidence in [0, 1] for one low/medium/high probability triple.
+
+    0.6 * entropy confidence + 0.4 * top-two margin, rounded to 3 places.
+    """
+    # Clip to avoid log(0), then normalize
+    p0 = min(max(p0, 1e-10), 1.0)
+    p1 = min(max(p1, 1e-10), 1.0)
+    p2 = min(max(p2, 1e-10), 1.0)
+    total = p0 + p1 + p2
+    p0, p1, p2 = p0 / total, p1 / total, p2 / total
+
+    entropy = -(p0 * math.log(p0) + p1 * math.log(p1) + p2 * math.log(p2))
+    entropy_confidence = 1 - entropy / LOG_3
+
+    # Top two probabilities via compares instead of a sort
+    if p0 < p1:
+        p0, p1 = p1, p0
+    if p1 < p2:
+        p1, p2 = p2, p1
+        if p0 < p1:
+            p0, p1 = p1, p0
+    margin = p0 - p1
+
+    return round(0.6 * entropy_confidence + 0.4 * margin, 3)
+
+
+# =============================================================================
+# BATCH KERNELS
+# =============================================================================
+
+def resilience_vec(
+    e: np.ndarray, h: np.ndarray, f: np.ndarray, we: float, wh: float, wf: float
+) -> np.ndarray:
+    """(N,) integer resilience scores from (N,) high-risk probability arrays."""
+    return np.clip(100 * (1 - (we * e + wh * h + wf * f)), 0, 100).astype(int)
+
+
+def confidence_vec(probs: np.ndarray) -> np.ndarray:
+    """(N,) confidence scores for an (N, C) probability matrix."""
+    p = np.clip(probs, 1e-10, 1.0)  # clip copies the input
+    p /= p.sum(axis=1, keepdims=True)
+
+    entropy = -(p * np.log(p)).sum(axis=1)
+    entropy_confidence = 1 - entropy / np.log(p.shape[1])
+
+    # Only the top two matter: partition instead of a full sort
+    if p.shape[1] > 1:
+        top = np.partition(p, -2, axis=1)
+        margin = top[:, -1] - top[:, -2]
+    else:
+        margin = p[:, 0]
+
+    return np.round(0.6 * entropy_confidence + 0.4 * margin, 3)
@@ -22,9 +22,17 @@ Architecture:
 """
 
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from functools import lru_cache
+import copy
 import os
+import hashlib
+import threading
 
+import joblib
+import sklearn
+
+from . import _fast
 from .models import (
     EnvironmentalRiskModel,
     HealthRiskModel,
@@ -34,7 +42,8 @@ from .preprocessing import (
     preprocess_environmental_metrics,
     preprocess_health_metrics,
     preprocess_food_metrics,
-    preprocess_all_metrics
+    preprocess_all_metrics_batch,
+    HEALTH_ENV_RISK_COL
 )
 
 
@@ -61,11 +70,37 @@ class CascadingRiskEngine:
         'food': 0.25
     }
     
+    # Policy interventions understood by _apply_policy_adjustments
+    POLICY_KEYS = (
+        'traffic_reduction', 'aqi_cap', 'emission_control',
+        'surge_capacity', 'emergency_staffing', 'infrastructure',
+        'import_stabilization', 'subsidy_rate', 'supply_chain_resilience'
+    )
+    
+    # Distinct metric dictionaries kept by the prediction cache
+    PREDICTION_CACHE_SIZE = 1024
+    
+    # Datasets read by real-data training (defaults of the real_data_loaders
+    # functions, relative to data_dir); their size/mtime key the checkpoint
+    REAL_DATA_FILES = (
+        'datasets/archive1/TrafficVolumeData.csv',
+        'datasets/archive3/aqi_india_38cols_knn_final.csv',
+        'raw_weekly_hospital_respiratory_data_2020_2024.csv',
+        'datasets/archive2/Agriculture_price_dataset.csv'
+    )
+    CHECKPOINT_FILE = 'cascading_engine.joblib'
+    
+    # Bump whenever pickled model state changes shape (new attributes,
+    # different input dtypes) so older checkpoints are retrained
+    CHECKPOINT_VERSION = 1
+    
     def __init__(
         self,
         data_dir: Optional[str] = None,
         use_real_data: bool = True,
-        auto_train: bool = True
+        auto_train: bool = True,
+        checkpoint_dir: Optional[str] = None,
+        force_retrain: bool = False
     ):
         """
         Initialize Cascading Risk Engine.
@@ -74,9 +109,14 @@ class CascadingRiskEngine:
             data_dir: Directory containing datasets (for real data training)
             use_real_data: If True, train on real data; else use synthetic
             auto_train: If True, automatically train models on init
+            checkpoint_dir: If set, auto_train loads trained models from a
+                checkpoint here when the training data is unchanged, and
+                writes one after training otherwise
+            force_retrain: If True, ignore any existing checkpoint
         """
         self.data_dir = data_dir or os.path.dirname(os.path.dirname(__file__))
         self.use_real_data = use_real_data
+        self.checkpoint_dir = checkpoint_dir
         
         # Initialize models
         self.env_model = EnvironmentalRiskModel()
@@ -86,8 +126,15 @@ class CascadingRiskEngine:
         self._is_trained = False
         self._training_info = {}
         
+        # Per-engine LRU of single predictions, keyed by _metrics_key
+        self._cached_prediction = self._new_prediction_cache()
+        
         if auto_train:
-            self.train_models()
+            if checkpoint_dir is None:
+                self.train_models()
+            elif force_retrain or not self._load_checkpoint():
+                self.train_models()
+                self._save_checkpoint()
     
     def train_models(self):
         """Train all three models."""
@@ -97,6 +144,8 @@ class CascadingRiskEngine:
             self._train_on_synthetic_data()
         
         self._is_trained = True
+        # Cached results came from the previous models
+        self._cached_prediction.cache_clear()
     
     def _train_on_real_data(self):
         """Train models on real datasets."""
@@ -106,35 +155,27 @@ class CascadingRiskEngine:
             load_food_security_data
         )
         
-        original_dir = os.getcwd()
-        try:
-            if self.data_dir:
-                os.chdir(self.data_dir)
-            
-            print("Training Cascading Risk Engine on REAL DATA...")
-            
-            # Environmental
-            print("  [1/3] Training Environmental Model...")
-            X_env, y_env, _ = load_environmental_data()
-            self.env_model.train(X_env, y_env)
-            self._training_info['environmental'] = {'samples': len(y_env)}
-            
-            # Health
-            print("  [2/3] Training Health Model...")
-            X_health, y_health, _ = load_health_data()
-            self.health_model.train(X_health, y_health)
-            self._training_info['health'] = {'samples': len(y_health)}
-            
-            # Food Security
-            print("  [3/3] Training Food Security Model...")
-            X_food, y_food, _ = load_food_security_data()
-            self.food_model.train(X_food, y_food)
-            self._training_info['food'] = {'samples': len(y_food)}
-            
-            print("Cascading Risk Engine ready!")
-            
-        finally:
-            os.chdir(original_dir)
+        print("Training Cascading Risk Engine on REAL DATA...")
+        
+        # Environmental
+        print("  [1/3] Training Environmental Model...")
+        X_env, y_env, _ = load_environmental_data(data_dir=self.data_dir)
+        self.env_model.train(X_env, y_env)
+        self._training_info['environmental'] = {'samples': len(y_env)}
+        
+        # Health
+        print("  [2/3] Training Health Model...")
+        X_health, y_health, _ = load_health_data(data_dir=self.data_dir)
+        self.health_model.train(X_health, y_health)
+        self._training_info['health'] = {'samples': len(y_health)}
+        
+        # Food Security
+        print("  [3/3] Training Food Security Model...")
+        X_food, y_food, _ = load_food_security_data(data_dir=self.data_dir)
+        self.food_model.train(X_food, y_food)
+        self._training_info['food'] = {'samples': len(y_food)}
+        
+        print("Cascading Risk Engine ready!")
     
     def _train_on_synthetic_data(self):
         """Train models on synthetic data."""
@@ -154,6 +195,74 @@ class CascadingRiskEngine:
         
         print("Cascading Risk Engine ready!")
     
+    def _checkpoint_key(self) -> str:
+        """
+        Fingerprint of the training setup a checkpoint was built from.
+        
+        Covers CHECKPOINT_VERSION, the scikit-learn version the models were
+        pickled under, the data source and, for real data, the size and
+        mtime of each dataset, so code upgrades and edited datasets
+        invalidate the checkpoint.
+        """
+        parts = [
+            f"checkpoint_version={self.CHECKPOINT_VERSION}",
+            f"sklearn={sklearn.__version__}",
+            f"use_real_data={self.use_real_data}"
+        ]
+        if self.use_real_data:
+            for name in self.REAL_DATA_FILES:
+                try:
+                    st = os.stat(os.path.join(self.data_dir, name))
+                    parts.append(f"{name}:{st.st_size}:{st.st_mtime_ns}")
+                except OSError:
+                    parts.append(f"{name}:missing")
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+    
+    def _checkpoint_path(self) -> str:
+        return os.path.join(self.checkpoint_dir, self.CHECKPOINT_FILE)
+    
+    def _save_checkpoint(self):
+        """Write the trained models to checkpoint_dir."""
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        joblib.dump({
+            'key': self._checkpoint_key(),
+            'env_model': self.env_model,
+            'health_model': self.health_model,
+            'food_model': self.food_model,
+            'training_info': self._training_info
+        }, self._checkpoint_path())
+    
+    def _load_checkpoint(self) -> bool:
+        """
+        Load trained models from checkpoint_dir if they match the current
+        training setup.
+        
+        Returns:
+            True if the models were loaded, False if training is needed
+        """
+        path = self._checkpoint_path()
+        if not os.path.exists(path):
+            return False
+        try:
+            # Uncompressed, so NumPy arrays map from the file instead of
+            # being copied into memory
+            checkpoint = joblib.load(path, mmap_mode='r')
+        except Exception as e:
+            print(f"Ignoring unreadable model checkpoint {path}: {e}")
+            return False
+        if checkpoint.get('key') != self._checkpoint_key():
+            print("Model checkpoint is stale, retraining...")
+            return False
+        
+        self.env_model = checkpoint['env_model']
+        self.health_model = checkpoint['health_model']
+        self.food_model = checkpoint['food_model']
+        self._training_info = checkpoint['training_info']
+        self._is_trained = True
+        self._cached_prediction.cache_clear()
+        print(f"Cascading Risk Engine loaded from checkpoint {path}")
+        return True
+    
     # =========================================================================
     # PART 1: CASCADING INFERENCE
     # =========================================================================
@@ -196,121 +305,141 @@ class CascadingRiskEngine:
                 "cascading_effect": {...}  # Info about the cascade
             }
         """
+        try:
+            key = self._metrics_key(metrics)
+        except TypeError:
+            # Unhashable or unorderable inputs are predicted without caching
+            return self.predict_cascading_risks_batch([metrics])[0]
+        
+        # Copy so callers can modify the result without touching the cache
+        return copy.deepcopy(self._cached_prediction(key))
+    
+    @staticmethod
+    def _metrics_key(metrics: Dict[str, Any]) -> Tuple:
+        """
+        Hashable cache key for a metrics dictionary.
+        
+        Values are kept exact and paired with their type, since e.g. 600 and
+        600.0 produce differently worded assumptions. Raises TypeError when
+        a value is unhashable.
+        """
+        key = tuple((k, type(v), v) for k, v in sorted(metrics.items()))
+        hash(key)
+        return key
+    
+    def _new_prediction_cache(self):
+        """LRU-cached _predict_from_key bound to this engine."""
+        return lru_cache(maxsize=self.PREDICTION_CACHE_SIZE)(self._predict_from_key)
+    
+    def _predict_from_key(self, key: Tuple) -> Dict:
+        """Uncached single prediction for a _metrics_key key."""
+        return self.predict_cascading_risks_batch([{k: v for k, _, v in key}])[0]
+    
+    def predict_cascading_risks_batch(self, metrics_list: List[Dict[str, Any]]) -> List[Dict]:
+        """
+        Predict cascading risks for many metric dictionaries at once.
+        
+        Rows are stacked into (N, F) matrices so each model is called once
+        per batch; the cascade becomes a column assignment of P_env into
+        the health features. Useful for scoring many cities/timesteps or
+        policy sweeps.
+        
+        Args:
+            metrics_list: Sequence of metrics dictionaries (see
+                predict_cascading_risks for the expected fields)
+        
+        Returns:
+            List of result dictionaries, in input order, each shaped like
+            the output of predict_cascading_risks
+        """
         if not self._is_trained:
             raise RuntimeError("Models must be trained before prediction")
         
-        # Preprocess all metrics
-        env_metrics, health_metrics, food_metrics, assumptions = preprocess_all_metrics(metrics)
+        if len(metrics_list) == 0:
+            return []
         
-        # =====================================================================
-        # STEP 1: Predict Environmental Risk
-        # =====================================================================
-        X_env = np.array([[
-            env_metrics['aqi'],
-            env_metrics['traffic_density'],
-            env_metrics['temperature'],
-            env_metrics['rainfall']
-        ]])
-        
-        env_result = self.env_model.predict_with_proba(X_env)
-        env_probs = {
-            'low': float(env_result['probabilities']['low'][0]),
-            'medium': float(env_result['probabilities']['medium'][0]),
-            'high': float(env_result['probabilities']['high'][0])
-        }
-        env_risk_class = env_result['class'][0]
-        env_high_prob = env_probs['high']
+        env_P, health_P, food_P, resilience_scores, assumptions = (
+            self._predict_batch_arrays(metrics_list)
+        )
         
-        # =====================================================================
-        # STEP 2: Predict Health Risk WITH CASCADING P_env
-        # This is the key innovation - P_env causally conditions P_health
-        # =====================================================================
+        # STEP 5: Confidence scores, one vectorized call per model
+        env_confidence = self._calculate_confidence_vec(env_P)
+        health_confidence = self._calculate_confidence_vec(health_P)
+        food_confidence = self._calculate_confidence_vec(food_P)
+        
+        env_labels = self.env_model.labels_from_proba(env_P)
+        health_labels = self.health_model.labels_from_proba(health_P)
+        food_labels = self.food_model.labels_from_proba(food_P)
+        
+        # BUILD OUTPUT (dictionaries are only materialized here, one per row)
+        results = []
+        for i in range(len(metrics_list)):
+            env_probs = dict(zip(self.env_model.class_names, env_P[i].tolist()))
+            health_probs = dict(zip(self.health_model.class_names, health_P[i].tolist()))
+            food_probs = dict(zip(self.food_model.class_names, food_P[i].tolist()))
+            env_high_prob = env_probs['high']
+            
+            results.append({
+                "environmental": {
+                    "risk": env_labels[i],
+                    "prob": env_high_prob,
+                    "probabilities": env_probs
+                },
+                "health": {
+                    "risk": health_labels[i],
+                    "prob": health_probs['high'],
+                    "probabilities": health_probs
+                },
+                "food_security": {
+                    "risk": food_labels[i],
+                    "prob": food_probs['high'],
+                    "probabilities": food_probs
+                },
+                "resilience_score": int(resilience_scores[i]),
+                "confidence": {
+                    "environmental": float(env_confidence[i]),
+                    "health": float(health_confidence[i]),
+                    "food_security": float(food_confidence[i])
+                },
+                "cascading_effect": {
+                    "env_risk_injected_to_health": env_high_prob,
+                    "description": f"Environmental risk probability ({env_high_prob:.2%}) was used as input to health model"
+                },
+                "assumptions": assumptions[i] if assumptions[i] else None
+            })
         
-        # Inject environmental risk probability into health prediction
-        health_metrics['environmental_risk_prob'] = env_high_prob
-        
-        X_health = np.array([[
-            health_metrics['aqi'],
-            health_metrics['hospital_load'],
-            health_metrics['respiratory_cases'],
-            health_metrics['temperature'],
-            health_metrics['environmental_risk_prob']  # CASCADING INPUT
-        ]])
-        
-        health_result = self.health_model.predict_with_proba(X_health)
-        health_probs = {
-            'low': float(health_result['probabilities']['low'][0]),
-            'medium': float(health_result['probabilities']['medium'][0]),
-            'high': float(health_result['probabilities']['high'][0])
-        }
-        health_risk_class = health_result['class'][0]
-        health_high_prob = health_probs['high']
+        return results
+    
+    def _predict_batch_arrays(self, metrics_list: List[Dict[str, Any]]) -> Tuple:
+        """
+        Run the cascade on a non-empty batch and return raw per-model arrays.
         
-        # =====================================================================
-        # STEP 3: Predict Food Security Risk (Independent/Parallel)
-        # =====================================================================
-        X_food = np.array([[
-            food_metrics['crop_supply_index'],
-            food_metrics['food_price_index'],
-            food_metrics['rainfall'],
-            food_metrics['temperature'],
-            food_metrics['supply_disruption_events']
-        ]])
-        
-        food_result = self.food_model.predict_with_proba(X_food)
-        food_probs = {
-            'low': float(food_result['probabilities']['low'][0]),
-            'medium': float(food_result['probabilities']['medium'][0]),
-            'high': float(food_result['probabilities']['high'][0])
-        }
-        food_risk_class = food_result['class'][0]
-        food_high_prob = food_probs['high']
+        Returns:
+            Tuple of (env_P, health_P, food_P, resilience_scores, assumptions)
+            where each P is an (N, 3) probability matrix in the model's class_names order
+        """
+        # Preprocess all rows into stacked feature matrices
+        X_env, X_health, X_food, assumptions = preprocess_all_metrics_batch(metrics_list)
         
-        # =====================================================================
-        # STEP 4: Calculate Resilience Score (0-100)
-        # =====================================================================
-        resilience_score = self._calculate_resilience_score(
-            env_high_prob, health_high_prob, food_high_prob
-        )
+        # STEP 1: Environmental risk
+        env_P = self.env_model.predict_proba(X_env)
+        env_high = env_P[:, self.env_model.high_idx]
         
-        # =====================================================================
-        # STEP 5: Calculate Confidence Scores
-        # =====================================================================
-        env_confidence = self._calculate_confidence(list(env_probs.values()))
-        health_confidence = self._calculate_confidence(list(health_probs.values()))
-        food_confidence = self._calculate_confidence(list(food_probs.values()))
+        # STEP 2: Health risk WITH CASCADING P_env (reserved column of X_health)
+        X_health[:, HEALTH_ENV_RISK_COL] = env_high
+        health_P = self.health_model.predict_proba(X_health)
         
-        # =====================================================================
-        # BUILD OUTPUT
-        # =====================================================================
-        return {
-            "environmental": {
-                "risk": env_risk_class,
-                "prob": env_high_prob,
-                "probabilities": env_probs
-            },
-            "health": {
-                "risk": health_risk_class,
-                "prob": health_high_prob,
-                "probabilities": health_probs
-            },
-            "food_security": {
-                "risk": food_risk_class,
-                "prob": food_high_prob,
-                "probabilities": food_probs
-            },
-            "resilience_score": resilience_score,
-            "confidence": {
-                "environmental": env_confidence,
-                "health": health_confidence,
-                "food_security": food_confidence
-            },
-            "cascading_effect": {
-                "env_risk_injected_to_health": env_high_prob,
-                "description": f"Environmental risk probability ({env_high_prob:.2%}) was used as input to health model"
-            },
-            "assumptions": assumptions if assumptions else None
-        }
+        # STEP 3: Food security risk (independent/parallel)
+        food_P = self.food_model.predict_proba(X_food)
+        
+        # STEP 4: Resilience scores for the whole batch
+        resilience_scores = self._calculate_resilience_score_vec(
+            env_high,
+            health_P[:, self.health_model.high_idx],
+            food_P[:, self.food_model.high_idx]
+        )
+        
+        return env_P, health_P, food_P, resilience_scores, assumptions
     
     def _calculate_resilience_score(
         self,
@@ -331,48 +460,49 @@ class CascadingRiskEngine:
             - Health: 40% (highest weight - public health priority)
             - Food: 25%
         """
-        weighted_risk = (
-            self.RESILIENCE_WEIGHTS['environmental'] * env_high_prob +
-            self.RESILIENCE_WEIGHTS['health'] * health_high_prob +
-            self.RESILIENCE_WEIGHTS['food'] * food_high_prob
+        w = self.RESILIENCE_WEIGHTS
+        return _fast.resilience(
+            env_high_prob, health_high_prob, food_high_prob,
+            w['environmental'], w['health'], w['food']
         )
+    
+    def _calculate_resilience_score_vec(
+        self,
+        env_high_prob: np.ndarray,
+        health_high_prob: np.ndarray,
+        food_high_prob: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized _calculate_resilience_score over (N,) probability arrays.
         
-        # Convert to resilience (inverse of risk)
-        resilience = 100 * (1 - weighted_risk)
-        
-        # Ensure valid range
-        return int(max(0, min(100, resilience)))
+        Returns an (N,) integer array of scores in [0, 100].
+        """
+        w = self.RESILIENCE_WEIGHTS
+        return _fast.resilience_vec(
+            env_high_prob, health_high_prob, food_high_prob,
+            w['environmental'], w['health'], w['food']
+        )
     
     def _calculate_confidence(self, probabilities: List[float]) -> float:
         """
-        Calculate prediction confidence score.
+        Calculate prediction confidence score for one probability vector.
+        
+        Expects low/medium/high probabilities; see _calculate_confidence_vec.
+        """
+        return _fast.confidence(*probabilities)
+    
+    @staticmethod
+    def _calculate_confidence_vec(probs: np.ndarray) -> np.ndarray:
+        """
+        Calculate prediction confidence scores for an (N, C) probability matrix.
         
         Uses two metrics:
         1. Entropy-based: Lower entropy = higher confidence
         2. Class separation: Larger margin = higher confidence
         
-        Combined into single score in [0, 1].
+        Combined into one score in [0, 1] per row; returns an (N,) array.
         """
-        probs = np.array(probabilities)
-        probs = np.clip(probs, 1e-10, 1.0)  # Avoid log(0)
-        
-        # Normalize if needed
-        probs = probs / probs.sum()
-        
-        # Entropy-based confidence (max entropy for 3 classes is log(3) ≈ 1.1)
-        entropy = -np.sum(probs * np.log(probs))
-        max_entropy = np.log(len(probs))
-        entropy_confidence = 1 - (entropy / max_entropy)
-        
-        # Class separation margin (difference between top two predictions)
-        sorted_probs = np.sort(probs)[::-1]
-        margin = sorted_probs[0] - sorted_probs[1] if len(sorted_probs) > 1 else sorted_probs[0]
-        margin_confidence = margin  # Already in [0, 1]
-        
-        # Combine (weighted average)
-        confidence = 0.6 * entropy_confidence + 0.4 * margin_confidence
-        
-        return round(float(confidence), 3)
+        return _fast.confidence_vec(probs)
     
     # =========================================================================
     # PART 2: POLICY-DRIVEN SCENARIO SIMULATION
@@ -412,20 +542,129 @@ class CascadingRiskEngine:
             - percent_change: Percentage risk changes
             - policies_applied: List of policies that were applied
         """
+        return self.run_policy_sweep(baseline_metrics, [policy_adjustments])[0]
+    
+    def run_policy_sweep(
+        self,
+        baseline_metrics: Dict[str, Any],
+        policy_adjustments_list: List[Dict[str, Any]]
+    ) -> List[Dict]:
+        """
+        Run several policy simulations against one baseline.
+        
+        The baseline and every intervention scenario are scored in a single
+        batched prediction, so each model is called once per sweep.
+        
+        Args:
+            baseline_metrics: Current state metrics
+            policy_adjustments_list: Policy intervention dictionaries (see
+                run_policy_scenario for the supported keys)
+        
+        Returns:
+            List of run_policy_scenario result dictionaries, one per entry
+            of policy_adjustments_list
+        """
         if not self._is_trained:
             raise RuntimeError("Models must be trained before simulation")
         
-        # Get baseline predictions
-        baseline = self.predict_cascading_risks(baseline_metrics)
+        # Apply policy adjustments to create intervention scenarios
+        intervention_metrics_list = self._apply_policy_columns(
+            baseline_metrics,
+            self._policy_columns(policy_adjustments_list),
+            len(policy_adjustments_list)
+        )
         
-        # Apply policy adjustments to create intervention scenario
-        intervention_metrics = self._apply_policy_adjustments(
-            baseline_metrics, policy_adjustments
+        # Baseline and intervention predictions in one batch
+        predictions = self.predict_cascading_risks_batch(
+            [baseline_metrics] + intervention_metrics_list
         )
+        baseline = predictions[0]
+        
+        results = []
+        for i, (policy_adjustments, intervention_metrics, intervention) in enumerate(
+            zip(policy_adjustments_list, intervention_metrics_list, predictions[1:])
+        ):
+            results.append(self._compare_scenarios(
+                # Each result owns its baseline so callers can modify it
+                baseline if i == 0 else copy.deepcopy(baseline),
+                intervention,
+                policy_adjustments,
+                intervention_metrics
+            ))
+        return results
+    
+    def run_policy_grid(
+        self,
+        baseline_metrics: Dict[str, Any],
+        policy_grid_spec: Dict[str, Any]
+    ) -> np.ndarray:
+        """
+        Score every combination of a grid of policy settings.
+        
+        Each policy in policy_grid_spec maps to a sequence of values; the
+        Cartesian product of those values (np.meshgrid) is applied to the
+        baseline and scored in one batched prediction.
+        
+        Example:
+            engine.run_policy_grid(metrics, {
+                'traffic_reduction': np.linspace(0, 0.5, 6),
+                'surge_capacity': np.linspace(0, 0.5, 6)
+            })  # 36 rows
+        
+        Args:
+            baseline_metrics: Current state metrics
+            policy_grid_spec: Policy name -> values to try; every name must
+                be one of POLICY_KEYS
         
-        # Get intervention predictions
-        intervention = self.predict_cascading_risks(intervention_metrics)
+        Returns:
+            Structured array with one row per grid point: a float field per
+            policy, the high-risk probabilities 'environmental', 'health'
+            and 'food_security', and the integer 'resilience_score'
+        """
+        if not self._is_trained:
+            raise RuntimeError("Models must be trained before simulation")
+        if not policy_grid_spec:
+            raise ValueError("policy_grid_spec must contain at least one policy")
+        unknown = [name for name in policy_grid_spec if name not in self.POLICY_KEYS]
+        if unknown:
+            raise ValueError(
+                f"Unknown policies in policy_grid_spec: {unknown}; "
+                f"expected any of {list(self.POLICY_KEYS)}"
+            )
+        
+        names = list(policy_grid_spec)
+        axes = [np.atleast_1d(np.asarray(v, dtype=float)) for v in policy_grid_spec.values()]
+        grid = np.column_stack([m.ravel() for m in np.meshgrid(*axes, indexing='ij')])
+        
+        intervention_metrics_list = self._apply_policy_columns(
+            baseline_metrics,
+            {name: grid[:, j] for j, name in enumerate(names)},
+            len(grid)
+        )
+        env_P, health_P, food_P, resilience_scores, _ = (
+            self._predict_batch_arrays(intervention_metrics_list)
+        )
         
+        out = np.empty(len(grid), dtype=[(name, 'f8') for name in names] + [
+            ('environmental', 'f8'), ('health', 'f8'), ('food_security', 'f8'),
+            ('resilience_score', 'i8')
+        ])
+        for j, name in enumerate(names):
+            out[name] = grid[:, j]
+        out['environmental'] = env_P[:, self.env_model.high_idx]
+        out['health'] = health_P[:, self.health_model.high_idx]
+        out['food_security'] = food_P[:, self.food_model.high_idx]
+        out['resilience_score'] = resilience_scores
+        return out
+    
+    @staticmethod
+    def _compare_scenarios(
+        baseline: Dict,
+        intervention: Dict,
+        policy_adjustments: Dict[str, Any],
+        intervention_metrics: Dict[str, Any]
+    ) -> Dict:
+        """Build a run_policy_scenario result from baseline and intervention predictions."""
         # Calculate deltas
         delta = {
             'environmental': baseline['environmental']['prob'] - intervention['environmental']['prob'],
@@ -468,91 +707,145 @@ class CascadingRiskEngine:
         
         Modifies metrics based on policy interventions.
         """
-        adjusted = dict(metrics)  # Copy
+        return self._apply_policy_columns(
+            metrics, self._policy_columns([policy_adjustments]), 1
+        )[0]
+    
+    @classmethod
+    def _policy_columns(cls, policy_adjustments_list: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        Stack policy dictionaries into (N,) float columns, one per known policy.
+        
+        NaN marks rows where the policy is absent; unknown keys are ignored.
+        """
+        return {
+            name: np.array([p.get(name, np.nan) for p in policy_adjustments_list], dtype=float)
+            for name in cls.POLICY_KEYS
+            if any(name in p for p in policy_adjustments_list)
+        }
+    
+    def _apply_policy_columns(
+        self,
+        metrics: Dict[str, Any],
+        policies: Dict[str, np.ndarray],
+        n: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply N rows of policy interventions to one set of baseline metrics.
+        
+        Every policy is lane-wise NumPy arithmetic over the N rows. A row
+        without a policy (NaN) gets the neutral value (0 or an infinite
+        cap), or keeps the unclipped value via np.where. Only metrics
+        present in the baseline are adjusted.
+        
+        Args:
+            metrics: Baseline metrics
+            policies: Policy name -> (N,) values, as built by _policy_columns
+            n: Number of scenarios
+        
+        Returns:
+            N adjusted copies of metrics
+        """
+        def policy(name, neutral=0.0):
+            values = policies.get(name)
+            if values is None:
+                return np.zeros(n, dtype=bool), np.full(n, neutral)
+            present = ~np.isnan(values)
+            return present, np.where(present, values, neutral)
+        
+        has_traffic_red, traffic_red = policy('traffic_reduction')
+        has_cap, aqi_cap = policy('aqi_cap', np.inf)
+        has_emission, emission = policy('emission_control')
+        has_surge, surge = policy('surge_capacity')
+        has_staffing, staffing = policy('emergency_staffing')
+        has_infra, infra = policy('infrastructure')
+        has_import, imports = policy('import_stabilization')
+        has_subsidy, subsidy = policy('subsidy_rate')
+        has_resilience, resilience = policy('supply_chain_resilience')
+        
+        # Metric -> (adjusted (N,) column, rows it applies to, cast, rows
+        # whose value comes from arithmetic rather than a cap alone)
+        columns = {}
         
         # =====================================================================
         # ENVIRONMENTAL POLICIES
         # =====================================================================
         
-        # Traffic reduction
-        if 'traffic_reduction' in policy_adjustments:
-            reduction = policy_adjustments['traffic_reduction']
-            if 'traffic_density' in adjusted:
-                # Deterministically reduce traffic level based on reduction percentage
-                current = adjusted['traffic_density']
-                # Strong reduction (>50%) drops traffic by 2 levels
-                # Medium reduction (>25%) drops by 1 level
-                if reduction >= 0.5 and current > 1:
-                    adjusted['traffic_density'] = current - 2
-                elif reduction >= 0.25 and current > 0:
-                    adjusted['traffic_density'] = current - 1
-                adjusted['traffic_density'] = max(0, adjusted['traffic_density'])
-                
-                # Also reduce AQI due to less traffic
-                if 'aqi' in adjusted:
-                    adjusted['aqi'] = adjusted['aqi'] * (1 - reduction * 0.3)
-        
-        # AQI cap (regulatory ceiling)
-        if 'aqi_cap' in policy_adjustments:
-            if 'aqi' in adjusted:
-                adjusted['aqi'] = min(adjusted['aqi'], policy_adjustments['aqi_cap'])
-        
-        # Emission control
-        if 'emission_control' in policy_adjustments:
-            if 'aqi' in adjusted:
-                adjusted['aqi'] = adjusted['aqi'] * (1 - policy_adjustments['emission_control'])
+        # Traffic reduction: strong (>=50%) drops traffic by 2 levels, medium
+        # (>=25%) by 1; AQI falls with traffic. Needs a traffic_density input.
+        traffic_applies = 'traffic_density' in metrics and has_traffic_red.any()
+        if traffic_applies:
+            current = float(metrics['traffic_density'])
+            traffic = np.where(
+                (traffic_red >= 0.5) & (current > 1), current - 2,
+                np.where((traffic_red >= 0.25) & (current > 0), current - 1, current)
+            )
+            cast = int if isinstance(metrics['traffic_density'], int) else float
+            columns['traffic_density'] = (np.maximum(0, traffic), has_traffic_red, cast, has_traffic_red)
+        
+        # Traffic-driven AQI reduction, then regulatory cap, then emission control
+        aqi_scaled = has_emission | (has_traffic_red if traffic_applies else False)
+        aqi_rows = has_cap | aqi_scaled
+        if 'aqi' in metrics and aqi_rows.any():
+            aqi = np.full(n, float(metrics['aqi']))
+            if traffic_applies:
+                aqi = aqi * (1 - traffic_red * 0.3)
+            aqi = np.minimum(aqi, aqi_cap)
+            aqi = aqi * (1 - emission)
+            columns['aqi'] = (aqi, aqi_rows, float, aqi_scaled)
         
         # =====================================================================
         # HEALTH POLICIES
         # =====================================================================
         
-        # Hospital surge capacity
-        if 'surge_capacity' in policy_adjustments:
-            if 'hospital_load' in adjusted:
-                # More capacity = lower effective load
-                adjusted['hospital_load'] = adjusted['hospital_load'] / (1 + policy_adjustments['surge_capacity'])
-                adjusted['hospital_load'] = max(0.4, min(0.95, adjusted['hospital_load']))
-        
-        # Emergency staffing
-        if 'emergency_staffing' in policy_adjustments:
-            if 'hospital_load' in adjusted:
-                # More staff = can handle more patients
-                load_reduction = policy_adjustments['emergency_staffing'] * 0.5
-                adjusted['hospital_load'] = adjusted['hospital_load'] * (1 - load_reduction)
-                adjusted['hospital_load'] = max(0.4, min(0.95, adjusted['hospital_load']))
-        
-        # Infrastructure investment
-        if 'infrastructure' in policy_adjustments:
-            if 'hospital_load' in adjusted:
-                adjusted['hospital_load'] = adjusted['hospital_load'] * (1 - policy_adjustments['infrastructure'] * 0.4)
-            if 'respiratory_cases' in adjusted:
-                adjusted['respiratory_cases'] = int(adjusted['respiratory_cases'] * (1 - policy_adjustments['infrastructure'] * 0.3))
+        # Surge capacity and emergency staffing lower the effective load (each
+        # clipped to 0.4-0.95); infrastructure lowers load and respiratory cases
+        load_rows = has_surge | has_staffing | has_infra
+        if 'hospital_load' in metrics and load_rows.any():
+            load = np.full(n, float(metrics['hospital_load']))
+            load = np.where(has_surge, np.clip(load / (1 + surge), 0.4, 0.95), load)
+            load = np.where(has_staffing, np.clip(load * (1 - staffing * 0.5), 0.4, 0.95), load)
+            load = load * (1 - infra * 0.4)
+            columns['hospital_load'] = (load, load_rows, float, load_rows)
+        
+        if 'respiratory_cases' in metrics and has_infra.any():
+            cases = np.trunc(float(metrics['respiratory_cases']) * (1 - infra * 0.3))
+            columns['respiratory_cases'] = (cases, has_infra, int, has_infra)
         
         # =====================================================================
         # FOOD SECURITY POLICIES
         # =====================================================================
         
-        # Import stabilization
-        if 'import_stabilization' in policy_adjustments:
-            if 'crop_supply_index' in adjusted:
-                adjusted['crop_supply_index'] = adjusted['crop_supply_index'] * (1 + policy_adjustments['import_stabilization'])
-                adjusted['crop_supply_index'] = min(100, adjusted['crop_supply_index'])
-        
-        # Subsidy mechanism
-        if 'subsidy_rate' in policy_adjustments:
-            if 'food_price_index' in adjusted:
-                adjusted['food_price_index'] = adjusted['food_price_index'] * (1 - policy_adjustments['subsidy_rate'])
-                adjusted['food_price_index'] = max(80, adjusted['food_price_index'])
-        
-        # Supply chain resilience
-        if 'supply_chain_resilience' in policy_adjustments:
-            if 'supply_disruption_events' in adjusted:
-                reduction = policy_adjustments['supply_chain_resilience'] * 0.6
-                adjusted['supply_disruption_events'] = max(0, int(adjusted['supply_disruption_events'] * (1 - reduction)))
-            if 'food_price_index' in adjusted:
-                adjusted['food_price_index'] = adjusted['food_price_index'] * (1 - policy_adjustments['supply_chain_resilience'] * 0.2)
-        
-        return adjusted
+        # Import stabilization raises supply (capped at 100)
+        if 'crop_supply_index' in metrics and has_import.any():
+            supply = np.minimum(100, float(metrics['crop_supply_index']) * (1 + imports))
+            columns['crop_supply_index'] = (supply, has_import, float, has_import)
+        
+        # Subsidies (floored at 80) and supply chain resilience lower prices
+        price_rows = has_subsidy | has_resilience
+        if 'food_price_index' in metrics and price_rows.any():
+            price = np.full(n, float(metrics['food_price_index']))
+            price = np.where(has_subsidy, np.maximum(80, price * (1 - subsidy)), price)
+            price = price * (1 - resilience * 0.2)
+            columns['food_price_index'] = (price, price_rows, float, price_rows)
+        
+        # Supply chain resilience cuts disruption events
+        if 'supply_disruption_events' in metrics and has_resilience.any():
+            events = np.maximum(0, np.trunc(
+                float(metrics['supply_disruption_events']) * (1 - resilience * 0.6)
+            ))
+            columns['supply_disruption_events'] = (events, has_resilience, int, has_resilience)
+        
+        # Materialize one metrics dictionary per scenario; a value a cap left
+        # unchanged keeps the caller's object (and type)
+        adjusted_rows = [dict(metrics) for _ in range(n)]
+        for key, (values, rows, cast, computed) in columns.items():
+            original = metrics[key]
+            for i in np.flatnonzero(rows).tolist():
+                value = values[i].item()
+                capped_only = not computed[i] and value == original
+                adjusted_rows[i][key] = original if capped_only else cast(value)
+        return adjusted_rows
     
     # =========================================================================
     # UTILITY METHODS
@@ -562,6 +855,34 @@ class CascadingRiskEngine:
         """Return training information for all models."""
         return self._training_info
     
+    def save(self, path: str) -> str:
+        """
+        Save the engine, including its trained models, with joblib.
+        
+        Returns:
+            The path written
+        """
+        joblib.dump(self, path)
+        return path
+    
+    @classmethod
+    def load(cls, path: str) -> 'CascadingRiskEngine':
+        """Load an engine written by save(); no retraining is needed."""
+        engine = joblib.load(path)
+        if not isinstance(engine, cls):
+            raise TypeError(f"{path} does not contain a {cls.__name__}")
+        return engine
+    
+    def __getstate__(self):
+        # The prediction cache wraps a bound method and is not picklable
+        state = self.__dict__.copy()
+        state.pop('_cached_prediction', None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cached_prediction = self._new_prediction_cache()
+    
     def demo(self) -> str:
         """Run demonstration of cascading risk engine."""
         output = []
@@ -635,19 +956,34 @@ class CascadingRiskEngine:
 
 
 # Convenience function for direct import
+# Engine shared by the standalone functions below, trained on first use
+_DEFAULT_ENGINE: Optional[CascadingRiskEngine] = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def _default_engine() -> CascadingRiskEngine:
+    """Return the shared default engine, creating it once per process."""
+    global _DEFAULT_ENGINE
+    if _DEFAULT_ENGINE is None:
+        with _ENGINE_LOCK:
+            if _DEFAULT_ENGINE is None:
+                _DEFAULT_ENGINE = CascadingRiskEngine()
+    return _DEFAULT_ENGINE
+
+
 def predict_cascading_risks(metrics: Dict[str, Any], engine: Optional[CascadingRiskEngine] = None) -> Dict:
     """
     Standalone function for cascading risk prediction.
     
     Args:
         metrics: Input metrics dictionary
-        engine: Optional pre-initialized engine (creates new if None)
+        engine: Optional pre-initialized engine (shared default engine if None)
     
     Returns:
         Cascading risk prediction results
     """
     if engine is None:
-        engine = CascadingRiskEngine()
+        engine = _default_engine()
     return engine.predict_cascading_risks(metrics)
 
 
@@ -662,13 +998,13 @@ def run_policy_scenario(
     Args:
         baseline_metrics: Current state metrics
         policy_adjustments: Policy intervention parameters
-        engine: Optional pre-initialized engine (creates new if None)
+        engine: Optional pre-initialized engine (shared default engine if None)
     
     Returns:
         Policy scenario comparison results
     """
     if engine is None:
-        engine = CascadingRiskEngine()
+        engine = _default_engine()
     return engine.run_policy_scenario(baseline_metrics, policy_adjustments)
 
 
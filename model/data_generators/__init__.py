@@ -5,24 +5,44 @@ Each generator produces reproducible, rule-based labeled data
 with realistic correlations between features.
 
 Also includes real data loaders for training on actual datasets.
-"""
 
-from .environmental_data import generate_environmental_data
-from .health_data import generate_health_data
-from .food_security_data import generate_food_security_data
-from .real_data_loaders import (
-    load_environmental_data,
-    load_health_data,
-    load_food_security_data,
-    load_all_real_data
-)
+Package-level names are imported lazily: the risk models import their
+generator submodule directly, and the pandas-based real data loaders
+load only when one of them is first used.
+"""
 
 __all__ = [
     'generate_environmental_data',
-    'generate_health_data', 
+    'generate_health_data',
     'generate_food_security_data',
     'load_environmental_data',
     'load_health_data',
     'load_food_security_data',
     'load_all_real_data'
 ]
+
+import importlib
+
+# Public name -> defining submodule, imported on first attribute access (PEP 562)
+_LAZY = {
+    'generate_environmental_data': 'environmental_data',
+    'generate_health_data': 'health_data',
+    'generate_food_security_data': 'food_security_data',
+    'load_environmental_data': 'real_data_loaders',
+    'load_health_data': 'real_data_loaders',
+    'load_food_security_data': 'real_data_loaders',
+    'load_all_real_data': 'real_data_loaders',
+}
+
+
+def __getattr__(name):
+    modname = _LAZY.get(name)
+    if modname is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module('.' + modname, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
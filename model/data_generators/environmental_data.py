@@ -58,7 +58,9 @@ def generate_environmental_data(
         
         # Compare model predictions between scenarios
     """
-    np.random.seed(random_seed)
+    # Local generator: same stream as seeding the global one, without
+    # resetting np.random for the rest of the process
+    rng = np.random.RandomState(random_seed)
     
     # =========================================================================
     # FEATURE GENERATION WITH REALISTIC CORRELATIONS
@@ -67,13 +69,13 @@ def generate_environmental_data(
     # Base traffic density (categorical: 0=low, 1=medium, 2=high)
     # Distribution: 30% low, 45% medium, 25% high
     traffic_probs = np.array([0.30, 0.45, 0.25])
-    traffic_density = np.random.choice([0, 1, 2], size=n_samples, p=traffic_probs)
+    traffic_density = rng.choice([0, 1, 2], size=n_samples, p=traffic_probs)
     
     # POLICY HOOK: Apply traffic reduction
     # This simulates traffic management policies (e.g., congestion pricing, WFH mandates)
     if traffic_reduction_factor < 1.0:
         # Probabilistically reduce traffic levels
-        reduction_mask = np.random.random(n_samples) > traffic_reduction_factor
+        reduction_mask = rng.random(n_samples) > traffic_reduction_factor
         traffic_density = np.where(
             reduction_mask & (traffic_density > 0),
             traffic_density - 1,
@@ -81,14 +83,17 @@ def generate_environmental_data(
         )
     
     # Temperature (25-45°C, normally distributed around 32)
-    temperature = np.clip(np.random.normal(32, 5, n_samples), 25, 45)
+    temperature = np.clip(rng.normal(32, 5, n_samples), 25, 45)
     
     # Rainfall (0-100mm, right-skewed distribution - most days have low rainfall)
-    rainfall = np.clip(np.random.exponential(20, n_samples), 0, 100)
+    # Exponential truncated at 100mm by inverse-CDF sampling: clipping would
+    # pile the tail up as a point mass at exactly 100mm
+    rain_cdf_max = -np.expm1(-100 / 20)  # P(exponential(20) <= 100)
+    rainfall = -20 * np.log1p(-rng.uniform(0, rain_cdf_max, n_samples))
     
     # AQI - correlated with traffic, temperature; inversely with rainfall
     # Base AQI from traffic contribution
-    base_aqi = 50 + traffic_density * 40 + np.random.normal(0, 20, n_samples)
+    base_aqi = 50 + traffic_density * 40 + rng.normal(0, 20, n_samples)
     
     # Temperature effect (higher temp = more ozone = higher AQI)
     temp_effect = (temperature - 30) * 2
@@ -97,7 +102,7 @@ def generate_environmental_data(
     rain_effect = -rainfall * 0.5
     
     # Combined AQI with noise
-    aqi = base_aqi + temp_effect + rain_effect + np.random.normal(0, 30, n_samples)
+    aqi = base_aqi + temp_effect + rain_effect + rng.normal(0, 30, n_samples)
     
     # POLICY HOOK: Apply emission control factor
     # This simulates emission regulations (e.g., EV mandates, industrial controls)
@@ -115,21 +120,16 @@ def generate_environmental_data(
     # RULE-BASED LABELING
     # =========================================================================
     
-    labels = []
-    for i in range(n_samples):
-        # High risk conditions:
-        # - Very poor air quality (AQI > 200)
-        # - Poor air quality combined with high traffic (AQI > 150 AND traffic == 2)
-        if aqi[i] > 200 or (aqi[i] > 150 and traffic_density[i] == 2):
-            labels.append('high')
-        # Medium risk conditions:
-        # - Moderate air quality (AQI > 100)
-        # - High traffic regardless of AQI
-        elif aqi[i] > 100 or traffic_density[i] == 2:
-            labels.append('medium')
-        # Low risk: everything else
-        else:
-            labels.append('low')
+    # High risk conditions:
+    # - Very poor air quality (AQI > 200)
+    # - Poor air quality combined with high traffic (AQI > 150 AND traffic == 2)
+    high = (aqi > 200) | ((aqi > 150) & (traffic_density == 2))
+    # Medium risk conditions:
+    # - Moderate air quality (AQI > 100)
+    # - High traffic regardless of AQI
+    medium = (aqi > 100) | (traffic_density == 2)
+    # Low risk: everything else (first matching condition wins)
+    y = np.select([high, medium], ['high', 'medium'], default='low')
     
     # =========================================================================
     # PREPARE OUTPUT
@@ -137,7 +137,6 @@ def generate_environmental_data(
     
     # Feature matrix
     X = np.column_stack([aqi, traffic_density, temperature, rainfall])
-    y = np.array(labels)
     
     # DataFrame for inspection
     df = pd.DataFrame({
@@ -145,7 +144,7 @@ def generate_environmental_data(
         'traffic_density': traffic_density,
         'temperature': temperature,
         'rainfall': rainfall,
-        'risk_label': labels
+        'risk_label': y
     })
     
     return X, y, df
@@ -180,8 +179,13 @@ def apply_policy_to_features(
         emission_control_factor: Scale AQI by this factor
     
     Returns:
-        X_modified: Feature array with policy effects applied
+        X_modified: Feature array with policy effects applied (X itself,
+        not a copy, when no policy is active)
     """
+    # Baseline scenario: nothing to apply, skip the copy
+    if traffic_reduction_factor >= 1.0 and emission_control_factor >= 1.0 and aqi_cap is None:
+        return X
+    
     X_modified = X.copy()
     
     # Apply traffic reduction
@@ -38,20 +38,25 @@ def generate_food_security_data(
         y: Label array (n_samples,) with values 'low', 'medium', 'high'
         df: DataFrame with all features and labels for inspection
     """
-    np.random.seed(random_seed)
+    # Local generator: same stream as seeding the global one, without
+    # resetting np.random for the rest of the process
+    rng = np.random.RandomState(random_seed)
     
     # =========================================================================
     # FEATURE GENERATION WITH AGRICULTURAL CORRELATIONS
     # =========================================================================
     
     # Rainfall (0-100mm) - affects crop production
-    rainfall = np.clip(np.random.exponential(30, n_samples), 0, 100)
+    # Exponential truncated at 100mm by inverse-CDF sampling: clipping would
+    # pile the tail up as a point mass at exactly 100mm
+    rain_cdf_max = -np.expm1(-100 / 30)  # P(exponential(30) <= 100)
+    rainfall = -30 * np.log1p(-rng.uniform(0, rain_cdf_max, n_samples))
     
     # Temperature (25-45°C)
-    temperature = np.clip(np.random.normal(32, 5, n_samples), 25, 45)
+    temperature = np.clip(rng.normal(32, 5, n_samples), 25, 45)
     
     # Supply disruption events (0-5) - Poisson distributed
-    supply_disruptions = np.clip(np.random.poisson(1.5, n_samples), 0, 5)
+    supply_disruptions = np.clip(rng.poisson(1.5, n_samples), 0, 5)
     
     # Crop supply index - affected by rainfall, temperature, disruptions
     # Optimal conditions: moderate rainfall (40-60mm), moderate temp (28-35°C)
@@ -70,7 +75,7 @@ def generate_food_security_data(
     
     crop_supply = np.clip(
         base_supply + rainfall_effect + temp_effect + disruption_effect + 
-        np.random.normal(0, 10, n_samples),
+        rng.normal(0, 10, n_samples),
         40, 100
     )
     
@@ -82,7 +87,7 @@ def generate_food_security_data(
     
     food_price = np.clip(
         base_price + supply_price_effect + disruption_price_effect +
-        np.random.normal(0, 10, n_samples),
+        rng.normal(0, 10, n_samples),
         80, 150
     )
     
@@ -90,22 +95,17 @@ def generate_food_security_data(
     # RULE-BASED LABELING
     # =========================================================================
     
-    labels = []
-    for i in range(n_samples):
-        # High risk conditions:
-        # - Very low crop supply
-        # - Very high food prices
-        # - Multiple supply disruptions
-        if crop_supply[i] < 60 or food_price[i] > 130 or supply_disruptions[i] > 3:
-            labels.append('high')
-        # Medium risk conditions:
-        # - Moderately low supply
-        # - Moderately high prices
-        elif crop_supply[i] < 75 or food_price[i] > 110:
-            labels.append('medium')
-        # Low risk
-        else:
-            labels.append('low')
+    # High risk conditions:
+    # - Very low crop supply
+    # - Very high food prices
+    # - Multiple supply disruptions
+    high = (crop_supply < 60) | (food_price > 130) | (supply_disruptions > 3)
+    # Medium risk conditions:
+    # - Moderately low supply
+    # - Moderately high prices
+    medium = (crop_supply < 75) | (food_price > 110)
+    # Low risk: everything else (first matching condition wins)
+    y = np.select([high, medium], ['high', 'medium'], default='low')
     
     # =========================================================================
     # PREPARE OUTPUT
@@ -114,7 +114,6 @@ def generate_food_security_data(
     X = np.column_stack([
         crop_supply, food_price, rainfall, temperature, supply_disruptions
     ])
-    y = np.array(labels)
     
     df = pd.DataFrame({
         'crop_supply_index': crop_supply,
@@ -122,7 +121,7 @@ def generate_food_security_data(
         'rainfall': rainfall,
         'temperature': temperature,
         'supply_disruption_events': supply_disruptions,
-        'risk_label': labels
+        'risk_label': y
     })
     
     return X, y, df
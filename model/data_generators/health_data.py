@@ -38,7 +38,7 @@ def generate_health_data(
                            If None, generates synthetic probabilities.
     
     Returns:
-        X: Feature array (n_samples, 5)
+        X: float32 feature array (n_samples, 5)
         y: Label array (n_samples,) with values 'low', 'medium', 'high'
         df: DataFrame with all features and labels for inspection
     
@@ -47,39 +47,41 @@ def generate_health_data(
         environmental conditions and health outcomes. When the environmental
         model predicts high risk, this propagates to increase health risk.
     """
-    np.random.seed(random_seed)
+    # Local generator: same stream as seeding the global one, without
+    # resetting np.random for the rest of the process
+    rng = np.random.RandomState(random_seed)
     
     # =========================================================================
     # FEATURE GENERATION
     # =========================================================================
     
     # AQI - similar distribution to environmental data
-    aqi = np.clip(np.random.normal(120, 60, n_samples), 0, 500)
+    aqi = np.clip(rng.normal(120, 60, n_samples), 0, 500)
     
     # Hospital load (0.4-0.95) - tends toward higher values
-    hospital_load = np.clip(np.random.beta(5, 3, n_samples) * 0.6 + 0.35, 0.4, 0.95)
+    hospital_load = np.clip(rng.beta(5, 3, n_samples) * 0.6 + 0.35, 0.4, 0.95)
     
     # Temperature
-    temperature = np.clip(np.random.normal(32, 5, n_samples), 25, 45)
+    temperature = np.clip(rng.normal(32, 5, n_samples), 25, 45)
     
     # Respiratory cases - correlated with AQI
-    # Base cases + AQI effect + random noise
+    # Base cases + AQI effect + random noise (50-400 fits int16)
     base_cases = 100
     aqi_effect = aqi * 0.5  # Higher AQI = more cases
     respiratory_cases = np.clip(
-        base_cases + aqi_effect + np.random.normal(0, 50, n_samples),
+        base_cases + aqi_effect + rng.normal(0, 50, n_samples),
         50, 400
-    ).astype(int)
+    ).astype(np.int16)
     
     # Environmental risk probability (CASCADING INPUT)
     if base_env_risk_prob is not None:
         # Use provided probabilities (from actual environmental model)
-        env_risk_prob = base_env_risk_prob
+        env_risk_prob = np.asarray(base_env_risk_prob)
     else:
         # Generate synthetic probabilities correlated with AQI
         # This simulates what the environmental model would output
         env_risk_prob = np.clip(
-            (aqi - 50) / 300 + np.random.normal(0, 0.1, n_samples),
+            (aqi - 50) / 300 + rng.normal(0, 0.1, n_samples),
             0, 1
         )
     
@@ -87,36 +89,35 @@ def generate_health_data(
     # RULE-BASED LABELING WITH CASCADING LOGIC
     # =========================================================================
     
-    labels = []
-    for i in range(n_samples):
-        # High risk conditions (CASCADING EFFECT):
-        # - High environmental risk AND stressed hospital system
-        # - Very high hospital load alone
-        # - Extreme respiratory case count
-        if (env_risk_prob[i] > 0.7 and hospital_load[i] > 0.75) or \
-           hospital_load[i] > 0.90 or \
-           respiratory_cases[i] > 350:
-            labels.append('high')
-        # Medium risk conditions:
-        # - Moderate environmental risk
-        # - Moderate hospital load
-        # - Elevated respiratory cases
-        elif env_risk_prob[i] > 0.5 or \
-             hospital_load[i] > 0.65 or \
-             respiratory_cases[i] > 250:
-            labels.append('medium')
-        # Low risk
-        else:
-            labels.append('low')
+    # High risk conditions (CASCADING EFFECT):
+    # - High environmental risk AND stressed hospital system
+    # - Very high hospital load alone
+    # - Extreme respiratory case count
+    high = (
+        ((env_risk_prob > 0.7) & (hospital_load > 0.75)) |
+        (hospital_load > 0.90) |
+        (respiratory_cases > 350)
+    )
+    # Medium risk conditions:
+    # - Moderate environmental risk
+    # - Moderate hospital load
+    # - Elevated respiratory cases
+    medium = (
+        (env_risk_prob > 0.5) |
+        (hospital_load > 0.65) |
+        (respiratory_cases > 250)
+    )
+    # Low risk: everything else (first matching condition wins)
+    y = np.select([high, medium], ['high', 'medium'], default='low')
     
     # =========================================================================
     # PREPARE OUTPUT
     # =========================================================================
     
+    # float32: the health RandomForest casts its input to float32 anyway
     X = np.column_stack([
         aqi, hospital_load, respiratory_cases, temperature, env_risk_prob
-    ])
-    y = np.array(labels)
+    ]).astype(np.float32)
     
     df = pd.DataFrame({
         'aqi': aqi,
@@ -124,7 +125,7 @@ def generate_health_data(
         'respiratory_cases': respiratory_cases,
         'temperature': temperature,
         'environmental_risk_prob': env_risk_prob,
-        'risk_label': labels
+        'risk_label': y
     })
     
     return X, y, df
@@ -15,6 +15,34 @@ from typing import Tuple, Optional
 import os
 
 
+def _resolve(path: str, data_dir: Optional[str]) -> str:
+    """Resolve a dataset path against data_dir (absolute paths are kept)."""
+    return os.path.join(data_dir, path) if data_dir else path
+
+
+def _aggregate_prices(df: pd.DataFrame, by: str, key_name: str, count: bool) -> pd.DataFrame:
+    """
+    Mean/std (and optional count) of Modal_Price plus mean Min/Max_Price per group.
+    
+    Reduces grouped columns directly instead of a dict-of-lists agg, which
+    builds a MultiIndex header that has to be flattened again.
+    """
+    grouped = df.groupby(by)
+    means = grouped[['Modal_Price', 'Min_Price', 'Max_Price']].mean()
+    modal = grouped['Modal_Price']
+    
+    columns = {
+        key_name: means.index,
+        'avg_price': means['Modal_Price'].to_numpy(),
+        'price_std': modal.std().to_numpy()
+    }
+    if count:
+        columns['num_markets'] = modal.count().to_numpy()
+    columns['min_price'] = means['Min_Price'].to_numpy()
+    columns['max_price'] = means['Max_Price'].to_numpy()
+    return pd.DataFrame(columns)
+
+
 # =============================================================================
 # ENVIRONMENTAL DATA LOADER
 # =============================================================================
@@ -22,7 +50,8 @@ import os
 def load_environmental_data(
     traffic_path: str = "datasets/archive1/TrafficVolumeData.csv",
     aqi_path: str = "datasets/archive3/aqi_india_38cols_knn_final.csv",
-    sample_size: Optional[int] = 10000
+    sample_size: Optional[int] = 10000,
+    data_dir: Optional[str] = None
 ) -> Tuple[np.ndarray, np.ndarray, pd.DataFrame]:
     """
     Load real environmental data for training.
@@ -31,6 +60,8 @@ def load_environmental_data(
     - Traffic Volume: Contains AQI, temperature, rain, traffic volume
     - India AQI: Contains detailed pollution metrics
     
+    Relative paths are resolved against data_dir when it is given.
+    
     Returns:
         X: Features [aqi, traffic_density, temperature, rainfall]
         y: Labels ['low', 'medium', 'high']
@@ -38,11 +69,12 @@ def load_environmental_data(
     """
     print("Loading Environmental Data...")
     
-    # Traffic data already has most features we need
-    df_traffic = pd.read_csv(traffic_path)
+    # Traffic data already has most features we need; parse only those columns
+    cols_to_use = ['air_pollution_index', 'traffic_volume', 'temperature', 'rain_p_h']
+    df_traffic = pd.read_csv(_resolve(traffic_path, data_dir), usecols=cols_to_use)
     
-    # Rename and select columns
-    df = df_traffic[['air_pollution_index', 'traffic_volume', 'temperature', 'rain_p_h']].copy()
+    # Rename and select columns (usecols keeps file order, so select explicitly)
+    df = df_traffic[cols_to_use].copy()
     df.columns = ['aqi', 'traffic_volume', 'temperature', 'rainfall']
     
     # Drop missing values
@@ -50,14 +82,11 @@ def load_environmental_data(
     
     # Convert traffic volume to density categories (low/medium/high)
     # Using percentiles: 0-33% = low(0), 33-66% = medium(1), 66-100% = high(2)
-    traffic_p33 = df['traffic_volume'].quantile(0.33)
-    traffic_p66 = df['traffic_volume'].quantile(0.66)
+    traffic_volume = df['traffic_volume'].to_numpy()
+    traffic_edges = np.quantile(traffic_volume, [0.33, 0.66])
     
-    df['traffic_density'] = pd.cut(
-        df['traffic_volume'],
-        bins=[-np.inf, traffic_p33, traffic_p66, np.inf],
-        labels=[0, 1, 2]
-    ).astype(int)
+    # Bins are closed on the right: volume == p33 is still low
+    df['traffic_density'] = np.searchsorted(traffic_edges, traffic_volume, side='left')
     
     # Convert temperature from Kelvin to Celsius if needed
     if df['temperature'].mean() > 200:  # Likely Kelvin
@@ -65,21 +94,15 @@ def load_environmental_data(
     
     # Create risk labels based on real thresholds
     # Using EPA AQI categories as reference
-    def label_risk(row):
-        aqi = row['aqi']
-        traffic = row['traffic_density']
-        
-        # High risk: Unhealthy AQI (>150) or very unhealthy (>200)
-        if aqi > 200 or (aqi > 150 and traffic == 2):
-            return 'high'
-        # Medium risk: Moderate to Unhealthy for Sensitive Groups
-        elif aqi > 100 or traffic == 2:
-            return 'medium'
-        # Low risk: Good to Moderate
-        else:
-            return 'low'
-    
-    df['risk_label'] = df.apply(label_risk, axis=1)
+    aqi = df['aqi'].to_numpy()
+    traffic = df['traffic_density'].to_numpy()
+    
+    # High risk: Unhealthy AQI (>150) or very unhealthy (>200)
+    high = (aqi > 200) | ((aqi > 150) & (traffic == 2))
+    # Medium risk: Moderate to Unhealthy for Sensitive Groups
+    medium = (aqi > 100) | (traffic == 2)
+    # Low risk: Good to Moderate
+    df['risk_label'] = np.select([high, medium], ['high', 'medium'], default='low')
     
     # Sample if needed
     if sample_size and len(df) > sample_size:
@@ -101,7 +124,8 @@ def load_environmental_data(
 
 def load_health_data(
     hospital_path: str = "raw_weekly_hospital_respiratory_data_2020_2024.csv",
-    sample_size: Optional[int] = None
+    sample_size: Optional[int] = None,
+    data_dir: Optional[str] = None
 ) -> Tuple[np.ndarray, np.ndarray, pd.DataFrame]:
     """
     Load real health/hospital data for training.
@@ -114,16 +138,16 @@ def load_health_data(
     - Total respiratory cases (COVID + Influenza + RSV)
     - Simulated AQI correlation
     
+    Relative paths are resolved against data_dir when it is given.
+    
     Returns:
-        X: Features [aqi, hospital_load, respiratory_cases, temperature, env_risk_prob]
+        X: float32 features [aqi, hospital_load, respiratory_cases, temperature, env_risk_prob]
         y: Labels ['low', 'medium', 'high']
         df: Full DataFrame for inspection
     """
     print("Loading Health Data...")
     
-    df = pd.read_csv(hospital_path)
-    
-    # Select relevant columns
+    # Select relevant columns; the file has ~180, so skip parsing the rest
     cols_to_use = [
         'Percent Inpatient Beds Occupied',
         'Total Patients Hospitalized with COVID-19',
@@ -132,18 +156,25 @@ def load_health_data(
         'Percent ICU Beds Occupied'
     ]
     
+    df = pd.read_csv(_resolve(hospital_path, data_dir), usecols=cols_to_use)
+    
     df_health = df[cols_to_use].copy()
     df_health.columns = ['hospital_load', 'covid_cases', 'influenza_cases', 'rsv_cases', 'icu_load']
     
     # Drop missing values
     df_health = df_health.dropna()
     
+    # Derived columns are computed first and attached in one concat below
+    n = len(df_health)
+    
     # Calculate total respiratory cases
-    df_health['respiratory_cases'] = (
+    respiratory_cases = (
         df_health['covid_cases'] + 
         df_health['influenza_cases'] + 
         df_health['rsv_cases']
     )
+    resp_cases = respiratory_cases.to_numpy()
+    resp_max = resp_cases.max()
     
     # Normalize hospital load to 0-1 range if in percentage
     if df_health['hospital_load'].max() > 1:
@@ -151,45 +182,45 @@ def load_health_data(
     
     # Simulate AQI correlation (in real scenario, would merge with AQI dataset by date/location)
     # Using random values correlated with respiratory cases
-    np.random.seed(42)
-    base_aqi = 80 + df_health['respiratory_cases'] / df_health['respiratory_cases'].max() * 100
-    df_health['aqi'] = np.clip(base_aqi + np.random.normal(0, 20, len(df_health)), 30, 300)
+    # Local generator: same draws as np.random.seed(42), without touching global state
+    rng = np.random.RandomState(42)
+    base_aqi = 80 + respiratory_cases / resp_max * 100
+    aqi = np.clip(base_aqi + rng.normal(0, 20, n), 30, 300)
     
     # Simulate temperature (seasonal correlation)
-    df_health['temperature'] = np.random.normal(28, 8, len(df_health))
-    df_health['temperature'] = np.clip(df_health['temperature'], 10, 45)
+    temperature = np.clip(rng.normal(28, 8, n), 10, 45)
     
     # Simulate environmental risk probability (would come from environmental model in Phase 2)
-    df_health['env_risk_prob'] = np.clip(
-        (df_health['aqi'] - 50) / 200 + np.random.normal(0, 0.1, len(df_health)),
-        0, 1
-    )
+    env_risk_prob = np.clip((aqi - 50) / 200 + rng.normal(0, 0.1, n), 0, 1)
     
     # Create risk labels
-    def label_health_risk(row):
-        hospital_load = row['hospital_load']
-        icu_load = row['icu_load'] / 100 if row['icu_load'] > 1 else row['icu_load']
-        resp_cases = row['respiratory_cases']
-        
-        # Normalize respiratory cases
-        resp_normalized = resp_cases / df_health['respiratory_cases'].max()
-        
-        # High risk: High hospital load or ICU stress
-        if hospital_load > 0.85 or icu_load > 0.80 or resp_normalized > 0.7:
-            return 'high'
-        elif hospital_load > 0.65 or icu_load > 0.60 or resp_normalized > 0.4:
-            return 'medium'
-        else:
-            return 'low'
-    
-    df_health['risk_label'] = df_health.apply(label_health_risk, axis=1)
+    hospital_load = df_health['hospital_load'].to_numpy()
+    icu_raw = df_health['icu_load'].to_numpy()
+    icu_load = np.where(icu_raw > 1, icu_raw / 100, icu_raw)
+    
+    # Normalize respiratory cases (max taken once, shared with base_aqi)
+    resp_normalized = resp_cases / resp_max
+    
+    # High risk: High hospital load or ICU stress
+    high = (hospital_load > 0.85) | (icu_load > 0.80) | (resp_normalized > 0.7)
+    medium = (hospital_load > 0.65) | (icu_load > 0.60) | (resp_normalized > 0.4)
+    
+    derived = pd.DataFrame({
+        'respiratory_cases': respiratory_cases,
+        'aqi': aqi,
+        'temperature': temperature,
+        'env_risk_prob': env_risk_prob,
+        'risk_label': np.select([high, medium], ['high', 'medium'], default='low')
+    }, index=df_health.index)
+    df_health = pd.concat([df_health, derived], axis=1)
     
     # Sample if needed
     if sample_size and len(df_health) > sample_size:
         df_health = df_health.sample(n=sample_size, random_state=42)
     
     # Prepare output
-    X = df_health[['aqi', 'hospital_load', 'respiratory_cases', 'temperature', 'env_risk_prob']].values
+    # float32: the health RandomForest casts its input to float32 anyway
+    X = df_health[['aqi', 'hospital_load', 'respiratory_cases', 'temperature', 'env_risk_prob']].to_numpy(np.float32)
     y = df_health['risk_label'].values
     
     print(f"  Loaded {len(df_health)} samples")
@@ -204,7 +235,8 @@ def load_health_data(
 
 def load_food_security_data(
     agriculture_path: str = "datasets/archive2/Agriculture_price_dataset.csv",
-    sample_size: Optional[int] = 10000
+    sample_size: Optional[int] = 10000,
+    data_dir: Optional[str] = None
 ) -> Tuple[np.ndarray, np.ndarray, pd.DataFrame]:
     """
     Load real agriculture/food price data for training.
@@ -217,6 +249,8 @@ def load_food_security_data(
     - food_price_index: Normalized modal prices
     - supply_disruption_events: Price spikes count
     
+    Relative paths are resolved against data_dir when it is given.
+    
     Returns:
         X: Features [crop_supply, food_price, rainfall, temperature, disruptions]
         y: Labels ['low', 'medium', 'high']
@@ -224,22 +258,20 @@ def load_food_security_data(
     """
     print("Loading Food Security Data...")
     
-    df = pd.read_csv(agriculture_path)
+    # Only these columns are used below; skip parsing the rest
+    df = pd.read_csv(
+        _resolve(agriculture_path, data_dir),
+        usecols=['Price Date', 'Commodity', 'Min_Price', 'Max_Price', 'Modal_Price']
+    )
     
     # Convert Price Date to datetime
     df['Price Date'] = pd.to_datetime(df['Price Date'], errors='coerce')
     
-    # Filter to have valid prices
-    df = df[df['Modal_Price'] > 0].copy()
+    # Filter to have valid prices (later steps only read the filtered frame)
+    df = df[df['Modal_Price'] > 0]
     
     # Group by date to get daily aggregates
-    daily = df.groupby('Price Date').agg({
-        'Modal_Price': ['mean', 'std', 'count'],
-        'Min_Price': 'mean',
-        'Max_Price': 'mean'
-    }).reset_index()
-    
-    daily.columns = ['date', 'avg_price', 'price_std', 'num_markets', 'min_price', 'max_price']
+    daily = _aggregate_prices(df, 'Price Date', 'date', count=True)
     
     # Drop missing values
     daily = daily.dropna()
@@ -247,52 +279,57 @@ def load_food_security_data(
     if len(daily) < 100:
         print("  Warning: Not enough daily data, using raw aggregates")
         # Use commodity-level aggregation instead
-        commodity_agg = df.groupby('Commodity').agg({
-            'Modal_Price': ['mean', 'std'],
-            'Min_Price': 'mean',
-            'Max_Price': 'mean'
-        }).reset_index()
-        commodity_agg.columns = ['commodity', 'avg_price', 'price_std', 'min_price', 'max_price']
+        commodity_agg = _aggregate_prices(df, 'Commodity', 'commodity', count=False)
         daily = commodity_agg.dropna()
     
-    # Create features
+    # Create features (computed first and attached in one concat below)
+    n = len(daily)
+    rng = np.random.RandomState(42)
+    
+    # Simulate weather data (would need separate weather dataset for real implementation)
+    # Drawn first so these match the former np.random.seed(42) stream;
+    # rainfall is exponential truncated at 100mm (inverse CDF, no clipping)
+    rain_cdf_max = -np.expm1(-100 / 30)  # P(exponential(30) <= 100)
+    rainfall = -30 * np.log1p(-rng.uniform(0, rain_cdf_max, n))
+    temperature = np.clip(rng.normal(30, 6, n), 20, 45)
+    
     # Food price index: Normalized to 80-150 range
-    price_min, price_max = daily['avg_price'].min(), daily['avg_price'].max()
-    daily['food_price_index'] = 80 + (daily['avg_price'] - price_min) / (price_max - price_min) * 70
+    avg_price = daily['avg_price']
+    price_min, price_max = avg_price.min(), avg_price.max()
+    food_price_index = 80 + (avg_price - price_min) / (price_max - price_min) * 70
     
     # Crop supply index: Inverse of price volatility (higher volatility = lower supply stability)
     # Range: 40-100
     if 'price_std' in daily.columns and daily['price_std'].max() > 0:
         vol_normalized = daily['price_std'] / daily['price_std'].max()
-        daily['crop_supply_index'] = 100 - vol_normalized * 60
+        crop_supply_index = 100 - vol_normalized * 60
     else:
-        daily['crop_supply_index'] = np.random.uniform(50, 90, len(daily))
+        crop_supply_index = rng.uniform(50, 90, n)
     
     # Price spread as disruption indicator
-    daily['price_spread'] = (daily['max_price'] - daily['min_price']) / daily['avg_price']
-    spread_threshold = daily['price_spread'].quantile(0.7)
-    daily['supply_disruption_events'] = (daily['price_spread'] > spread_threshold).astype(int) * np.random.randint(1, 4, len(daily))
-    
-    # Simulate weather data (would need separate weather dataset for real implementation)
-    np.random.seed(42)
-    daily['rainfall'] = np.clip(np.random.exponential(30, len(daily)), 0, 100)
-    daily['temperature'] = np.clip(np.random.normal(30, 6, len(daily)), 20, 45)
+    price_spread = (daily['max_price'] - daily['min_price']) / avg_price
+    spread_threshold = price_spread.quantile(0.7)
+    supply_disruption_events = (price_spread > spread_threshold).astype(int) * rng.randint(1, 4, n)
     
     # Create risk labels
-    def label_food_risk(row):
-        supply = row['crop_supply_index']
-        price = row['food_price_index']
-        disruptions = row['supply_disruption_events']
-        
-        # High risk: Low supply, high prices, or many disruptions
-        if supply < 60 or price > 130 or disruptions >= 3:
-            return 'high'
-        elif supply < 75 or price > 110 or disruptions >= 2:
-            return 'medium'
-        else:
-            return 'low'
-    
-    daily['risk_label'] = daily.apply(label_food_risk, axis=1)
+    supply = np.asarray(crop_supply_index)
+    price = food_price_index.to_numpy()
+    disruptions = supply_disruption_events.to_numpy()
+    
+    # High risk: Low supply, high prices, or many disruptions
+    high = (supply < 60) | (price > 130) | (disruptions >= 3)
+    medium = (supply < 75) | (price > 110) | (disruptions >= 2)
+    
+    derived = pd.DataFrame({
+        'food_price_index': food_price_index,
+        'crop_supply_index': crop_supply_index,
+        'price_spread': price_spread,
+        'supply_disruption_events': supply_disruption_events,
+        'rainfall': rainfall,
+        'temperature': temperature,
+        'risk_label': np.select([high, medium], ['high', 'medium'], default='low')
+    }, index=daily.index)
+    daily = pd.concat([daily, derived], axis=1)
     
     # Sample if needed
     if sample_size and len(daily) > sample_size:
@@ -312,10 +349,14 @@ def load_food_security_data(
 # MAIN LOADER FUNCTION
 # =============================================================================
 
-def load_all_real_data() -> dict:
+def load_all_real_data(data_dir: Optional[str] = None) -> dict:
     """
     Load all real datasets for model training.
     
+    Args:
+        data_dir: Directory the default dataset paths are relative to
+            (current directory if None)
+    
     Returns:
         Dictionary with X, y, df for each model type
     """
@@ -326,15 +367,15 @@ def load_all_real_data() -> dict:
     print("=" * 60)
     
     # Environmental
-    X_env, y_env, df_env = load_environmental_data()
+    X_env, y_env, df_env = load_environmental_data(data_dir=data_dir)
     data['environmental'] = {'X': X_env, 'y': y_env, 'df': df_env}
     
     # Health
-    X_health, y_health, df_health = load_health_data()
+    X_health, y_health, df_health = load_health_data(data_dir=data_dir)
     data['health'] = {'X': X_health, 'y': y_health, 'df': df_health}
     
     # Food Security
-    X_food, y_food, df_food = load_food_security_data()
+    X_food, y_food, df_food = load_food_security_data(data_dir=data_dir)
     data['food'] = {'X': X_food, 'y': y_food, 'df': df_food}
     
     print("\n" + "=" * 60)
@@ -11,9 +11,33 @@ Explanations reference real inputs and avoid absolute claims.
 
 import numpy as np
 from typing import Dict, Any, List, Optional
+from joblib import Memory
 from sklearn.inspection import permutation_importance
 
 
+def _permutation_importance_mean(
+    estimator,
+    X: np.ndarray,
+    y: np.ndarray,
+    n_repeats: int,
+    scoring: Optional[str] = None
+) -> np.ndarray:
+    """
+    Mean permutation importance per feature.
+    
+    Deterministic in its arguments (fixed random_state), so it can be
+    memoized on disk keyed by the fitted estimator and data.
+    """
+    result = permutation_importance(
+        estimator,
+        X, y,
+        n_repeats=n_repeats,
+        random_state=42,
+        scoring=scoring
+    )
+    return result.importances_mean
+
+
 class ExplainabilityEngine:
     """
     Generates human-readable explanations for risk predictions.
@@ -39,15 +63,37 @@ class ExplainabilityEngine:
         'hazardous': (301, 500)
     }
     
-    def __init__(self, cascading_engine=None):
+    # Description per traffic_density level (0/1/2)
+    TRAFFIC_LEVELS = ('low', 'medium', 'high')
+    
+    # Default alert thresholds for get_decision_signals
+    DECISION_THRESHOLDS = {
+        'high_risk': 0.7,
+        'medium_risk': 0.4,
+        'high_confidence': 0.8,
+        'low_confidence': 0.6
+    }
+    
+    def __init__(self, cascading_engine=None, cache_dir: Optional[str] = None):
         """
         Initialize explainability engine.
         
         Args:
             cascading_engine: Optional CascadingRiskEngine for feature importance
+            cache_dir: If set, permutation importances are also cached on
+                disk here (joblib.Memory), so they survive process restarts;
+                entries are keyed by the fitted model and scoring data
         """
         self.engine = cascading_engine
+        self.cache_dir = cache_dir
+        # (model_name, n_repeats) -> (calibrated_model, importance dict)
         self._cached_importance = {}
+        
+        self._permutation_importance = _permutation_importance_mean
+        if cache_dir is not None:
+            self._permutation_importance = Memory(cache_dir, verbose=0).cache(
+                _permutation_importance_mean
+            )
     
     def compute_feature_importance(
         self,
@@ -66,6 +112,9 @@ class ExplainabilityEngine:
         
         Returns:
             Dictionary mapping feature names to importance scores
+        
+        Results are cached until the model is retrained: every sampling
+        step below is seeded, so they depend only on the fitted model.
         """
         if self.engine is None:
             raise RuntimeError("CascadingRiskEngine required for feature importance")
@@ -82,57 +131,59 @@ class ExplainabilityEngine:
         else:
             raise ValueError(f"Unknown model: {model_name}")
         
+        # train() builds a new calibrated_model, which invalidates the entry
+        cache_key = (model_name, n_repeats)
+        cached = self._cached_importance.get(cache_key)
+        if cached is not None and cached[0] is model.calibrated_model:
+            return dict(cached[1])
+        
         # Try to get native feature importance (RF)
         if hasattr(model.base_model, 'feature_importances_'):
             importances = model.base_model.feature_importances_
         else:
             # Use stored calibration data for permutation importance
             if hasattr(model, 'calibration_X') and model.calibration_X is not None and model.calibration_y is not None:
-                result = permutation_importance(
+                importances = self._permutation_importance(
                     model.calibrated_model,
                     model.calibration_X,
                     model.calibration_y,
-                    n_repeats=n_repeats,
-                    random_state=42,
+                    n_repeats,
                     scoring='accuracy'
                 )
-                importances = result.importances_mean
             else:
-                # Generate sample data for importance calculation
-                from .data_generators import generate_health_data, generate_environmental_data, generate_food_security_data
-                if model_name == 'health':
-                    X, y, _ = generate_health_data(n_samples=500)
-                elif model_name == 'environmental':
-                    X, y, _ = generate_environmental_data(n_samples=500)
-                else:
-                    X, y, _ = generate_food_security_data(n_samples=500)
+                # Generate sample data for importance calculation; it is
+                # seeded, so generate once and keep it on the model
+                sample = getattr(model, '_importance_sample', None)
+                if sample is None:
+                    from .data_generators import generate_health_data, generate_environmental_data, generate_food_security_data
+                    if model_name == 'health':
+                        X, y, _ = generate_health_data(n_samples=500)
+                    elif model_name == 'environmental':
+                        X, y, _ = generate_environmental_data(n_samples=500)
+                    else:
+                        X, y, _ = generate_food_security_data(n_samples=500)
+                    # Score against the encoded labels the model was fit on
+                    sample = (X, model.label_encoder.transform(y))
+                    model._importance_sample = sample
+                X, y = sample
                 
-                result = permutation_importance(
-                    model.calibrated_model,
-                    X, y,
-                    n_repeats=n_repeats,
-                    random_state=42
+                importances = self._permutation_importance(
+                    model.calibrated_model, X, y, n_repeats
                 )
-                importances = result.importances_mean
         
         # Normalize to sum to 1
         importances = np.abs(importances)
         if importances.sum() > 0:
             importances = importances / importances.sum()
         
-        importance_dict = {
-            name: round(float(imp), 4)
-            for name, imp in zip(feature_names, importances)
-        }
+        rounded = np.array([round(float(imp), 4) for imp in importances])
         
-        # Sort by importance
-        importance_dict = dict(sorted(
-            importance_dict.items(),
-            key=lambda x: x[1],
-            reverse=True
-        ))
+        # Sort by (rounded) importance, building the dict once in that order;
+        # stable, so ties keep feature order as sorted(reverse=True) did
+        order = np.argsort(-rounded, kind='stable')
+        importance_dict = {feature_names[i]: float(rounded[i]) for i in order}
         
-        self._cached_importance[model_name] = importance_dict
+        self._cached_importance[cache_key] = (model.calibrated_model, dict(importance_dict))
         return importance_dict
     
     def explain_prediction(
@@ -222,7 +273,9 @@ class ExplainabilityEngine:
         env_conf = predictions['confidence']['environmental']
         
         aqi_desc = self._describe_aqi(aqi)
-        traffic_desc = ['low', 'medium', 'high'][int(traffic)]
+        # Clamped: out-of-range input must not raise or wrap around to 'high'
+        level = min(max(int(traffic), 0), len(self.TRAFFIC_LEVELS) - 1)
+        traffic_desc = self.TRAFFIC_LEVELS[level]
         
         # Primary explanation
         exp = f"AQI of {aqi:.0f} ({aqi_desc}) "
@@ -374,6 +427,61 @@ class ExplainabilityEngine:
             f"Overall resilience score of {score}/100 ({level}). {desc}"
         )
     
+    def _decision_signal(
+        self,
+        prob: float,
+        confidence: float,
+        domain: str,
+        thresholds: Dict
+    ) -> Dict:
+        """Decision signal for one domain's risk probability and confidence."""
+        # Determine risk level
+        if prob >= thresholds['high_risk']:
+            risk_level = 'high'
+            urgency = 'immediate'
+        elif prob >= thresholds['medium_risk']:
+            risk_level = 'medium'
+            urgency = 'monitor'
+        else:
+            risk_level = 'low'
+            urgency = 'routine'
+        
+        # Adjust based on confidence
+        if confidence >= thresholds['high_confidence']:
+            confidence_level = 'high'
+            reliability = 'reliable'
+        elif confidence >= thresholds['low_confidence']:
+            confidence_level = 'medium'
+            reliability = 'moderate'
+        else:
+            confidence_level = 'low'
+            reliability = 'uncertain'
+        
+        # Generate signal
+        if risk_level == 'high' and confidence_level == 'high':
+            signal = 'ALERT'
+            action = f'Immediate action required for {domain}'
+        elif risk_level == 'high' and confidence_level != 'high':
+            signal = 'WARNING'
+            action = f'Review {domain} - high risk but lower confidence'
+        elif risk_level == 'medium':
+            signal = 'CAUTION'
+            action = f'Monitor {domain} closely'
+        else:
+            signal = 'OK'
+            action = f'{domain} within normal parameters'
+        
+        return {
+            'signal': signal,
+            'risk_level': risk_level,
+            'risk_probability': round(prob, 3),
+            'confidence': round(confidence, 3),
+            'confidence_level': confidence_level,
+            'reliability': reliability,
+            'urgency': urgency,
+            'recommended_action': action
+        }
+    
     def get_decision_signals(
         self,
         predictions: Dict,
@@ -392,77 +500,26 @@ class ExplainabilityEngine:
         Returns:
             Dictionary with decision signals per domain
         """
-        default_thresholds = {
-            'high_risk': 0.7,
-            'medium_risk': 0.4,
-            'high_confidence': 0.8,
-            'low_confidence': 0.6
-        }
-        thresholds = thresholds or default_thresholds
-        
-        def get_signal(prob: float, confidence: float, domain: str) -> Dict:
-            # Determine risk level
-            if prob >= thresholds['high_risk']:
-                risk_level = 'high'
-                urgency = 'immediate'
-            elif prob >= thresholds['medium_risk']:
-                risk_level = 'medium'
-                urgency = 'monitor'
-            else:
-                risk_level = 'low'
-                urgency = 'routine'
-            
-            # Adjust based on confidence
-            if confidence >= thresholds['high_confidence']:
-                confidence_level = 'high'
-                reliability = 'reliable'
-            elif confidence >= thresholds['low_confidence']:
-                confidence_level = 'medium'
-                reliability = 'moderate'
-            else:
-                confidence_level = 'low'
-                reliability = 'uncertain'
-            
-            # Generate signal
-            if risk_level == 'high' and confidence_level == 'high':
-                signal = 'ALERT'
-                action = f'Immediate action required for {domain}'
-            elif risk_level == 'high' and confidence_level != 'high':
-                signal = 'WARNING'
-                action = f'Review {domain} - high risk but lower confidence'
-            elif risk_level == 'medium':
-                signal = 'CAUTION'
-                action = f'Monitor {domain} closely'
-            else:
-                signal = 'OK'
-                action = f'{domain} within normal parameters'
-            
-            return {
-                'signal': signal,
-                'risk_level': risk_level,
-                'risk_probability': round(prob, 3),
-                'confidence': round(confidence, 3),
-                'confidence_level': confidence_level,
-                'reliability': reliability,
-                'urgency': urgency,
-                'recommended_action': action
-            }
+        thresholds = thresholds or self.DECISION_THRESHOLDS
         
         return {
-            'environmental': get_signal(
+            'environmental': self._decision_signal(
                 predictions['environmental']['prob'],
                 predictions['confidence']['environmental'],
-                'Environmental'
+                'Environmental',
+                thresholds
             ),
-            'health': get_signal(
+            'health': self._decision_signal(
                 predictions['health']['prob'],
                 predictions['confidence']['health'],
-                'Health'
+                'Health',
+                thresholds
             ),
-            'food_security': get_signal(
+            'food_security': self._decision_signal(
                 predictions['food_security']['prob'],
                 predictions['confidence']['food_security'],
-                'Food Security'
+                'Food Security',
+                thresholds
             ),
             'overall': {
                 'resilience_score': predictions['resilience_score'],
@@ -500,7 +557,8 @@ def explain_prediction(
 
 def get_feature_importance(
     cascading_engine,
-    model_name: str = 'health'
+    model_name: str = 'health',
+    cache_dir: Optional[str] = None
 ) -> Dict[str, float]:
     """
     Get feature importance for a model.
@@ -508,9 +566,10 @@ def get_feature_importance(
     Args:
         cascading_engine: Initialized CascadingRiskEngine
         model_name: 'environmental', 'health', or 'food'
+        cache_dir: Optional on-disk importance cache (see ExplainabilityEngine)
     
     Returns:
         Dictionary of feature names to importance scores
     """
-    explainer = ExplainabilityEngine(cascading_engine)
+    explainer = ExplainabilityEngine(cascading_engine, cache_dir=cache_dir)
     return explainer.compute_feature_importance(model_name)
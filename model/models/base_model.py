@@ -44,6 +44,9 @@ class BaseRiskModel(ABC):
         
         # Store training data for reliability curve generation
         self._calibration_data: Optional[Dict] = None
+        
+        # Calibrated-model column for each of class_names (set by train)
+        self._proba_order: Optional[np.ndarray] = None
     
     @abstractmethod
     def _create_base_model(self):
@@ -91,12 +94,29 @@ class BaseRiskModel(ABC):
         
         # Train calibrated model
         self.calibrated_model.fit(X, y_encoded)
+        self._set_proba_order()
         
         self._is_trained = True
         
         # Store predictions for reliability curve generation
         self._store_calibration_data(X, y_encoded)
     
+    def _set_proba_order(self):
+        """
+        Map the calibrated model's predict_proba columns onto class_names.
+        
+        sklearn orders columns by encoded class, and LabelEncoder sorts its
+        classes, so column 0 is 'high', not 'low'. predict_proba reorders
+        with this so its columns follow class_names.
+        """
+        column_labels = self.label_encoder.classes_[self.calibrated_model.classes_]
+        missing = [name for name in self.class_names if name not in column_labels]
+        if missing:
+            raise ValueError(f"Training labels are missing classes: {missing}")
+        self._proba_order = np.array([
+            np.flatnonzero(column_labels == name)[0] for name in self.class_names
+        ])
+    
     def _store_calibration_data(self, X: np.ndarray, y_encoded: np.ndarray):
         """Store data needed for reliability curve generation."""
         probas = self.calibrated_model.predict_proba(X)
@@ -117,11 +137,9 @@ class BaseRiskModel(ABC):
         Returns:
             Array of risk labels ('low', 'medium', 'high')
         """
-        if not self._is_trained:
-            raise RuntimeError("Model must be trained before prediction")
-        
-        y_encoded = self.calibrated_model.predict(X)
-        return self.label_encoder.inverse_transform(y_encoded)
+        # Through predict_proba so subclass fast paths apply; this is the
+        # argmax sklearn's predict() runs internally
+        return self.labels_from_proba(self.predict_proba(X))
     
     def predict_proba(self, X: np.ndarray) -> np.ndarray:
         """
@@ -132,12 +150,26 @@ class BaseRiskModel(ABC):
         
         Returns:
             Array of shape (n_samples, 3) with probabilities for [low, medium, high]
+            (class_names order)
         """
         if not self._is_trained:
             raise RuntimeError("Model must be trained before prediction")
         
+        # Models pickled before the column mapping existed derive it here
+        if getattr(self, '_proba_order', None) is None:
+            self._set_proba_order()
+        
+        return self._predict_proba_raw(X)[:, self._proba_order]
+    
+    def _predict_proba_raw(self, X: np.ndarray) -> np.ndarray:
+        """Calibrated probabilities in the calibrated model's column order."""
         return self.calibrated_model.predict_proba(X)
     
+    @property
+    def high_idx(self) -> int:
+        """Column of the 'high' class in predict_proba output."""
+        return self.class_names.index('high')
+    
     def predict_with_proba(self, X: np.ndarray) -> Dict:
         """
         Predict with full probability information.
@@ -155,8 +187,10 @@ class BaseRiskModel(ABC):
             raise RuntimeError("Model must be trained before prediction")
         
         probas = self.predict_proba(X)
-        predictions = self.calibrated_model.predict(X)
-        labels = self.label_encoder.inverse_transform(predictions)
+        # Same argmax the calibrated model's predict() would run, without
+        # evaluating the calibrated ensemble a second time
+        predictions = np.argmax(probas, axis=1)
+        labels = self.labels_from_proba(probas)
         
         # Get confidence (probability of predicted class)
         confidence = probas[np.arange(len(predictions)), predictions]
@@ -164,13 +198,46 @@ class BaseRiskModel(ABC):
         return {
             'class': labels,
             'probabilities': {
-                'low': probas[:, 0],
-                'medium': probas[:, 1],
-                'high': probas[:, 2]
+                name: probas[:, j] for j, name in enumerate(self.class_names)
             },
             'confidence': confidence
         }
     
+    def labels_from_proba(self, probas: np.ndarray) -> np.ndarray:
+        """
+        Risk labels for a predict_proba matrix (highest-probability class).
+        
+        Matches predict() without re-running the model.
+        """
+        # argmax over the calibrated model's own column order, so ties break
+        # exactly as sklearn's predict() would
+        raw_order = np.argsort(self._proba_order)
+        column = self.calibrated_model.classes_[np.argmax(probas[:, raw_order], axis=1)]
+        # Direct lookup: what inverse_transform does after ~100us of
+        # input validation
+        return self.label_encoder.classes_[column]
+    
+    def predict_single(self, X: np.ndarray) -> Dict:
+        """
+        Predict one sample and return plain Python values.
+        
+        Args:
+            X: Feature array of shape (1, n_features)
+        
+        Returns:
+            Dictionary with 'risk_class', 'probabilities' (low/medium/high
+            floats) and 'confidence' (probability of the predicted class)
+        """
+        probas = self.predict_proba(X)
+        # One tolist() on the row instead of a float() per class
+        p = probas[0].tolist()
+        
+        return {
+            'risk_class': self.labels_from_proba(probas)[0],
+            'probabilities': dict(zip(self.class_names, p)),
+            'confidence': max(p)
+        }
+    
     def get_reliability_curve_data(self) -> Optional[Dict]:
         """
         Get data needed to generate reliability curves (calibration plots).
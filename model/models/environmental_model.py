@@ -198,4 +198,4 @@ class EnvironmentalRiskModel(BaseRiskModel):
             Array of high-risk probabilities
         """
         probas = self.predict_proba(X)
-        return probas[:, 2]  # Column 2 = 'high' class
+        return probas[:, self.high_idx]
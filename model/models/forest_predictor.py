@@ -0,0 +1,171 @@
+"""
+Calibrated Forest Predictor
+
+NumPy re-implementation of predict_proba for a CalibratedClassifierCV
+wrapping a RandomForestClassifier with sigmoid calibration:
+- Every tree of every calibration fold is packed into flat node arrays
+- All rows walk all trees together, one tree level per step
+- Fold calibration, normalization and averaging follow sklearn's order
+
+For a handful of rows, sklearn's cost is per-call overhead (input
+validation, joblib dispatch, one Cython call per tree per fold); here it
+is max_depth vectorized gathers. sklearn is still used for training.
+"""
+
+from typing import Optional
+import numpy as np
+from scipy.special import expit
+
+
+class CalibratedForestPredictor:
+    """
+    Flattened, sklearn-free predictor for a fitted calibrated forest.
+    
+    Build with from_calibrated(); it returns None for models it does not
+    reproduce (non-sigmoid calibration, binary problems, non-forest
+    estimators), in which case callers keep using sklearn.
+    """
+    
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        leaf_proba: np.ndarray,
+        roots: np.ndarray,
+        a: np.ndarray,
+        b: np.ndarray,
+        n_features: int,
+        max_depth: int
+    ):
+        """
+        Args:
+            feature, threshold, left, right: (n_nodes,) node arrays for all
+                trees; leaves point to themselves so a walk can overrun them
+            leaf_proba: (n_nodes, n_classes) class fractions per node
+            roots: (n_folds * n_trees,) root node of each tree, fold-major
+            a, b: (n_folds, n_classes) sigmoid calibration parameters
+            n_features: Number of input features
+            max_depth: Deepest tree; number of traversal steps
+        """
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.leaf_proba = leaf_proba
+        self.roots = roots
+        self.a = a
+        self.b = b
+        self.n_features = n_features
+        self.max_depth = max_depth
+        self.n_folds, self.n_classes = a.shape
+    
+    @classmethod
+    def from_calibrated(cls, calibrated_model) -> Optional['CalibratedForestPredictor']:
+        """Pack a fitted CalibratedClassifierCV, or return None if unsupported."""
+        if calibrated_model.method != 'sigmoid':
+            return None
+        n_classes = len(calibrated_model.classes_)
+        if n_classes < 3:
+            return None
+        
+        feature, threshold, left, right, leaf_proba, roots = [], [], [], [], [], []
+        a, b = [], []
+        n_trees = None
+        max_depth = 0
+        offset = 0
+        
+        for fold in calibrated_model.calibrated_classifiers_:
+            # Renamed from base_estimator in sklearn 1.2
+            forest = getattr(fold, 'estimator', None)
+            if forest is None:
+                forest = fold.base_estimator
+            if (
+                not hasattr(forest, 'estimators_')
+                or forest.n_outputs_ != 1
+                or not np.array_equal(forest.classes_, fold.classes)
+            ):
+                return None
+            if n_trees is None:
+                n_trees = len(forest.estimators_)
+            elif len(forest.estimators_) != n_trees:
+                return None
+            
+            for estimator in forest.estimators_:
+                tree = estimator.tree_
+                nodes = np.arange(tree.node_count)
+                is_leaf = tree.children_left == -1
+                
+                roots.append(offset)
+                feature.append(np.where(is_leaf, 0, tree.feature))
+                threshold.append(tree.threshold)
+                left.append(np.where(is_leaf, nodes, tree.children_left) + offset)
+                right.append(np.where(is_leaf, nodes, tree.children_right) + offset)
+                # sklearn < 1.4 stores weighted class counts, later versions
+                # fractions; normalize so both give what predict_proba does
+                value = tree.value[:, 0, :n_classes]
+                total = value.sum(axis=1, keepdims=True)
+                leaf_proba.append(value / np.where(total == 0, 1.0, total))
+                max_depth = max(max_depth, tree.max_depth)
+                offset += tree.node_count
+            
+            a.append([calibrator.a_ for calibrator in fold.calibrators])
+            b.append([calibrator.b_ for calibrator in fold.calibrators])
+        
+        return cls(
+            feature=np.concatenate(feature).astype(np.intp),
+            threshold=np.concatenate(threshold),
+            left=np.concatenate(left).astype(np.intp),
+            right=np.concatenate(right).astype(np.intp),
+            leaf_proba=np.concatenate(leaf_proba),
+            roots=np.asarray(roots, dtype=np.intp),
+            a=np.asarray(a, dtype=np.float64),
+            b=np.asarray(b, dtype=np.float64),
+            n_features=calibrated_model.n_features_in_,
+            max_depth=max_depth
+        )
+    
+    def accepts(self, X, max_rows: int) -> bool:
+        """Whether X is a finite numeric (N, n_features) array, N <= max_rows."""
+        return (
+            isinstance(X, np.ndarray)
+            and X.ndim == 2
+            and 0 < X.shape[0] <= max_rows
+            and X.shape[1] == self.n_features
+            and X.dtype.kind in 'fiub'
+            and bool(np.isfinite(X).all())
+            # Values beyond float32 range become inf in the forest's own cast
+            and bool((np.abs(X) <= np.finfo(np.float32).max).all())
+        )
+    
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Calibrated (N, n_classes) probabilities; X must pass accepts().
+        """
+        # Trees compare float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        n = X.shape[0]
+        rows = np.arange(n)
+        
+        # (n_trees_total, N) current node per tree and row
+        node = np.repeat(self.roots[:, np.newaxis], n, axis=1)
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        
+        # Forest mean per fold: (n_folds, N, n_classes)
+        proba = self.leaf_proba[node].reshape(self.n_folds, -1, n, self.n_classes)
+        proba = proba.sum(axis=1) / proba.shape[1]
+        
+        # One-vs-rest sigmoid calibration, normalized per fold
+        proba = expit(-(self.a[:, np.newaxis, :] * proba + self.b[:, np.newaxis, :]))
+        denominator = proba.sum(axis=2, keepdims=True)
+        proba = np.divide(
+            proba, denominator,
+            out=np.full_like(proba, 1 / self.n_classes),
+            where=denominator != 0
+        )
+        proba[(1.0 < proba) & (proba <= 1.0 + 1e-5)] = 1.0
+        
+        return proba.sum(axis=0) / self.n_folds
@@ -15,11 +15,12 @@ Uses RandomForest because:
 - Good for the cascading relationship with environmental risk
 """
 
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier
 
 from .base_model import BaseRiskModel
+from .forest_predictor import CalibratedForestPredictor
 from ..data_generators.health_data import (
     generate_health_data,
     get_feature_names as get_health_feature_names
@@ -41,6 +42,9 @@ class HealthRiskModel(BaseRiskModel):
     This is the key innovation for multi-domain risk prediction.
     """
     
+    # Batches up to this size skip sklearn's per-call overhead (see _predict_proba_raw)
+    FAST_PREDICT_MAX_ROWS = 256
+    
     def __init__(
         self,
         calibration_method: str = 'sigmoid',
@@ -80,6 +84,28 @@ class HealthRiskModel(BaseRiskModel):
         """Return feature names including cascading environmental_risk_prob"""
         return self.feature_names
     
+    def train(self, X: Optional[np.ndarray] = None, y: Optional[np.ndarray] = None):
+        """Train the calibrated forest and pack it for fast prediction."""
+        super().train(X, y)
+        self._fast_predictor = CalibratedForestPredictor.from_calibrated(self.calibrated_model)
+    
+    def _predict_proba_raw(self, X: np.ndarray) -> np.ndarray:
+        """
+        Calibrated probabilities in the calibrated model's column order.
+        
+        Batches of up to FAST_PREDICT_MAX_ROWS finite rows are scored by the
+        packed NumPy forest; larger or unusual inputs go through sklearn,
+        whose per-call overhead is amortized over many rows.
+        """
+        # Models pickled before the fast path existed are packed on first use
+        if not hasattr(self, '_fast_predictor'):
+            self._fast_predictor = CalibratedForestPredictor.from_calibrated(self.calibrated_model)
+        
+        predictor = self._fast_predictor
+        if predictor is not None and predictor.accepts(X, self.FAST_PREDICT_MAX_ROWS):
+            return predictor.predict_proba(X)
+        return self.calibrated_model.predict_proba(X)
+    
     def predict_with_env_risk(
         self,
         aqi: np.ndarray,
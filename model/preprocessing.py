@@ -63,6 +63,13 @@ FOOD_RANGES = {
     'supply_disruption_events': (0, 10)
 }
 
+# Feature order of each model's input matrix (columns of the batch arrays)
+ENV_COLS = ('aqi', 'traffic_density', 'temperature', 'rainfall')
+HEALTH_COLS = ('aqi', 'hospital_load', 'respiratory_cases', 'temperature', 'environmental_risk_prob')
+FOOD_COLS = ('crop_supply_index', 'food_price_index', 'rainfall', 'temperature', 'supply_disruption_events')
+
+# Health column that carries the cascading P_env input
+HEALTH_ENV_RISK_COL = HEALTH_COLS.index('environmental_risk_prob')
 
 # =============================================================================
 # PREPROCESSING FUNCTIONS
@@ -87,26 +94,10 @@ def handle_missing(
     return value
 
 
-def preprocess_environmental_metrics(
-    metrics: Dict[str, Any],
-    log_assumptions: bool = True
-) -> Dict[str, float]:
-    """
-    Preprocess environmental input metrics.
-    
-    Args:
-        metrics: Raw input metrics dictionary
-        log_assumptions: Whether to log when defaults are used
-    
-    Returns:
-        Cleaned metrics with valid values
-    
-    Handles:
-        - Missing values → sensible defaults
-        - Out-of-range values → clipped to valid range
-        - Type conversion errors → defaults
-    """
-    processed = {}
+def _environmental_values(
+    metrics: Dict[str, Any]
+) -> Tuple[Tuple[float, ...], List[str]]:
+    """Clean environmental fields; returns values in ENV_COLS order and assumptions."""
     assumptions = []
     
     # AQI
@@ -124,7 +115,6 @@ def preprocess_environmental_metrics(
     except (TypeError, ValueError):
         aqi = ENVIRONMENTAL_DEFAULTS['aqi']
         assumptions.append(f"AQI invalid, using default: {aqi}")
-    processed['aqi'] = aqi
     
     # Traffic Density
     try:
@@ -139,7 +129,6 @@ def preprocess_environmental_metrics(
     except (TypeError, ValueError):
         traffic = ENVIRONMENTAL_DEFAULTS['traffic_density']
         assumptions.append(f"Traffic density invalid, using default: {traffic}")
-    processed['traffic_density'] = traffic
     
     # Temperature
     try:
@@ -158,7 +147,6 @@ def preprocess_environmental_metrics(
     except (TypeError, ValueError):
         temp = ENVIRONMENTAL_DEFAULTS['temperature']
         assumptions.append(f"Temperature invalid, using default: {temp}")
-    processed['temperature'] = temp
     
     # Rainfall
     try:
@@ -173,31 +161,43 @@ def preprocess_environmental_metrics(
     except (TypeError, ValueError):
         rain = ENVIRONMENTAL_DEFAULTS['rainfall']
         assumptions.append(f"Rainfall invalid, using default: {rain}")
-    processed['rainfall'] = rain
-    
-    if log_assumptions and assumptions:
-        processed['_assumptions'] = assumptions
     
-    return processed
+    return (aqi, traffic, temp, rain), assumptions
 
 
-def preprocess_health_metrics(
+def preprocess_environmental_metrics(
     metrics: Dict[str, Any],
-    env_risk_prob: Optional[float] = None,
     log_assumptions: bool = True
 ) -> Dict[str, float]:
     """
-    Preprocess health input metrics.
+    Preprocess environmental input metrics.
     
     Args:
         metrics: Raw input metrics dictionary
-        env_risk_prob: Environmental risk probability (cascading input)
         log_assumptions: Whether to log when defaults are used
     
     Returns:
         Cleaned metrics with valid values
+    
+    Handles:
+        - Missing values → sensible defaults
+        - Out-of-range values → clipped to valid range
+        - Type conversion errors → defaults
     """
-    processed = {}
+    values, assumptions = _environmental_values(metrics)
+    processed = dict(zip(ENV_COLS, values))
+    
+    if log_assumptions and assumptions:
+        processed['_assumptions'] = assumptions
+    
+    return processed
+
+
+def _health_values(
+    metrics: Dict[str, Any],
+    env_risk_prob: Optional[float] = None
+) -> Tuple[Tuple[float, ...], List[str]]:
+    """Clean health fields; returns values in HEALTH_COLS order and assumptions."""
     assumptions = []
     
     # AQI
@@ -208,7 +208,6 @@ def preprocess_health_metrics(
     except (TypeError, ValueError):
         aqi = HEALTH_DEFAULTS['aqi']
         assumptions.append(f"AQI invalid, using default: {aqi}")
-    processed['aqi'] = aqi
     
     # Hospital Load
     try:
@@ -222,7 +221,6 @@ def preprocess_health_metrics(
     except (TypeError, ValueError):
         load = HEALTH_DEFAULTS['hospital_load']
         assumptions.append(f"Hospital load invalid, using default: {load}")
-    processed['hospital_load'] = load
     
     # Respiratory Cases
     try:
@@ -232,7 +230,6 @@ def preprocess_health_metrics(
     except (TypeError, ValueError):
         cases = HEALTH_DEFAULTS['respiratory_cases']
         assumptions.append(f"Respiratory cases invalid, using default: {cases}")
-    processed['respiratory_cases'] = cases
     
     # Temperature
     try:
@@ -244,11 +241,10 @@ def preprocess_health_metrics(
     except (TypeError, ValueError):
         temp = HEALTH_DEFAULTS['temperature']
         assumptions.append(f"Temperature invalid, using default: {temp}")
-    processed['temperature'] = temp
     
     # Environmental Risk Probability (cascading input)
     if env_risk_prob is not None:
-        processed['environmental_risk_prob'] = clip_to_range(env_risk_prob, 0.0, 1.0)
+        erp = clip_to_range(env_risk_prob, 0.0, 1.0)
     else:
         try:
             erp = handle_missing(
@@ -262,29 +258,39 @@ def preprocess_health_metrics(
         except (TypeError, ValueError):
             erp = HEALTH_DEFAULTS['environmental_risk_prob']
             assumptions.append(f"Environmental risk prob invalid, using default: {erp}")
-        processed['environmental_risk_prob'] = erp
     
-    if log_assumptions and assumptions:
-        processed['_assumptions'] = assumptions
-    
-    return processed
+    return (aqi, load, cases, temp, erp), assumptions
 
 
-def preprocess_food_metrics(
+def preprocess_health_metrics(
     metrics: Dict[str, Any],
+    env_risk_prob: Optional[float] = None,
     log_assumptions: bool = True
 ) -> Dict[str, float]:
     """
-    Preprocess food security input metrics.
+    Preprocess health input metrics.
     
     Args:
         metrics: Raw input metrics dictionary
+        env_risk_prob: Environmental risk probability (cascading input)
         log_assumptions: Whether to log when defaults are used
     
     Returns:
         Cleaned metrics with valid values
     """
-    processed = {}
+    values, assumptions = _health_values(metrics, env_risk_prob)
+    processed = dict(zip(HEALTH_COLS, values))
+    
+    if log_assumptions and assumptions:
+        processed['_assumptions'] = assumptions
+    
+    return processed
+
+
+def _food_values(
+    metrics: Dict[str, Any]
+) -> Tuple[Tuple[float, ...], List[str]]:
+    """Clean food security fields; returns values in FOOD_COLS order and assumptions."""
     assumptions = []
     
     # Crop Supply Index
@@ -295,7 +301,6 @@ def preprocess_food_metrics(
     except (TypeError, ValueError):
         supply = FOOD_DEFAULTS['crop_supply_index']
         assumptions.append(f"Crop supply index invalid, using default: {supply}")
-    processed['crop_supply_index'] = supply
     
     # Food Price Index
     try:
@@ -305,7 +310,6 @@ def preprocess_food_metrics(
     except (TypeError, ValueError):
         price = FOOD_DEFAULTS['food_price_index']
         assumptions.append(f"Food price index invalid, using default: {price}")
-    processed['food_price_index'] = price
     
     # Rainfall
     try:
@@ -315,7 +319,6 @@ def preprocess_food_metrics(
     except (TypeError, ValueError):
         rain = FOOD_DEFAULTS['rainfall']
         assumptions.append(f"Rainfall invalid, using default: {rain}")
-    processed['rainfall'] = rain
     
     # Temperature
     try:
@@ -327,7 +330,6 @@ def preprocess_food_metrics(
     except (TypeError, ValueError):
         temp = FOOD_DEFAULTS['temperature']
         assumptions.append(f"Temperature invalid, using default: {temp}")
-    processed['temperature'] = temp
     
     # Supply Disruption Events
     try:
@@ -337,7 +339,26 @@ def preprocess_food_metrics(
     except (TypeError, ValueError):
         disruptions = FOOD_DEFAULTS['supply_disruption_events']
         assumptions.append(f"Supply disruptions invalid, using default: {disruptions}")
-    processed['supply_disruption_events'] = disruptions
+    
+    return (supply, price, rain, temp, disruptions), assumptions
+
+
+def preprocess_food_metrics(
+    metrics: Dict[str, Any],
+    log_assumptions: bool = True
+) -> Dict[str, float]:
+    """
+    Preprocess food security input metrics.
+    
+    Args:
+        metrics: Raw input metrics dictionary
+        log_assumptions: Whether to log when defaults are used
+    
+    Returns:
+        Cleaned metrics with valid values
+    """
+    values, assumptions = _food_values(metrics)
+    processed = dict(zip(FOOD_COLS, values))
     
     if log_assumptions and assumptions:
         processed['_assumptions'] = assumptions
@@ -366,3 +387,42 @@ def preprocess_all_metrics(metrics: Dict[str, Any]) -> Tuple[Dict, Dict, Dict, L
             all_assumptions.extend(m.pop('_assumptions'))
     
     return env_metrics, health_metrics, food_metrics, all_assumptions
+
+
+def preprocess_all_metrics_batch(
+    metrics_list: List[Dict[str, Any]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[List[str]]]:
+    """
+    Preprocess many metric dictionaries into column-ordered model inputs.
+    
+    Each row is cleaned exactly like preprocess_all_metrics and written
+    straight into preallocated arrays laid out as ENV_COLS, HEALTH_COLS
+    and FOOD_COLS, without building per-domain dictionaries.
+    
+    Args:
+        metrics_list: Sequence of combined metrics dictionaries
+    
+    Returns:
+        Tuple of (X_env (N, 4), X_health (N, 5) float32, X_food (N, 5),
+        per-row assumption lists). Column HEALTH_ENV_RISK_COL is a
+        placeholder that the cascading engine fills with the predicted
+        P_env.
+    """
+    n = len(metrics_list)
+    X_env = np.empty((n, len(ENV_COLS)))
+    # The health forest evaluates splits in float32 and would cast a
+    # float64 matrix once per calibration fold; the naive Bayes env/food
+    # models compute in float64, so their inputs stay float64
+    X_health = np.empty((n, len(HEALTH_COLS)), dtype=np.float32)
+    X_food = np.empty((n, len(FOOD_COLS)))
+    assumptions = []
+    
+    for i, metrics in enumerate(metrics_list):
+        X_env[i], env_assumptions = _environmental_values(metrics)
+        # The cascade slot is filled from environmental predictions, so any
+        # environmental_risk_prob in the input is not read (0.0 placeholder)
+        X_health[i], health_assumptions = _health_values(metrics, env_risk_prob=0.0)
+        X_food[i], food_assumptions = _food_values(metrics)
+        assumptions.append(env_assumptions + health_assumptions + food_assumptions)
+    
+    return X_env, X_health, X_food, assumptions
@@ -58,55 +58,45 @@ class RealDataRiskEngine:
     
     def train_on_real_data(self):
         """Train all three models on real datasets."""
-        original_dir = os.getcwd()
+        print("=" * 60)
+        print("TRAINING MODELS ON REAL DATA")
+        print("=" * 60)
         
-        try:
-            # Change to data directory for loading
-            if self.data_dir:
-                os.chdir(self.data_dir)
-            
-            print("=" * 60)
-            print("TRAINING MODELS ON REAL DATA")
-            print("=" * 60)
-            
-            # Environmental Model
-            print("\n[1] Training Environmental Risk Model...")
-            X_env, y_env, df_env = load_environmental_data()
-            self.env_model.train(X_env, y_env)
-            self._training_stats['environmental'] = {
-                'samples': len(y_env),
-                'class_distribution': dict(zip(*np.unique(y_env, return_counts=True)))
-            }
-            print(f"    Trained on {len(y_env)} samples")
-            
-            # Health Model
-            print("\n[2] Training Health Risk Model...")
-            X_health, y_health, df_health = load_health_data()
-            self.health_model.train(X_health, y_health)
-            self._training_stats['health'] = {
-                'samples': len(y_health),
-                'class_distribution': dict(zip(*np.unique(y_health, return_counts=True)))
-            }
-            print(f"    Trained on {len(y_health)} samples")
-            
-            # Food Security Model
-            print("\n[3] Training Food Security Risk Model...")
-            X_food, y_food, df_food = load_food_security_data()
-            self.food_model.train(X_food, y_food)
-            self._training_stats['food'] = {
-                'samples': len(y_food),
-                'class_distribution': dict(zip(*np.unique(y_food, return_counts=True)))
-            }
-            print(f"    Trained on {len(y_food)} samples")
-            
-            self._is_trained = True
-            
-            print("\n" + "=" * 60)
-            print("ALL MODELS TRAINED ON REAL DATA!")
-            print("=" * 60)
-            
-        finally:
-            os.chdir(original_dir)
+        # Environmental Model
+        print("\n[1] Training Environmental Risk Model...")
+        X_env, y_env, df_env = load_environmental_data(data_dir=self.data_dir)
+        self.env_model.train(X_env, y_env)
+        self._training_stats['environmental'] = {
+            'samples': len(y_env),
+            'class_distribution': dict(zip(*np.unique(y_env, return_counts=True)))
+        }
+        print(f"    Trained on {len(y_env)} samples")
+        
+        # Health Model
+        print("\n[2] Training Health Risk Model...")
+        X_health, y_health, df_health = load_health_data(data_dir=self.data_dir)
+        self.health_model.train(X_health, y_health)
+        self._training_stats['health'] = {
+            'samples': len(y_health),
+            'class_distribution': dict(zip(*np.unique(y_health, return_counts=True)))
+        }
+        print(f"    Trained on {len(y_health)} samples")
+        
+        # Food Security Model
+        print("\n[3] Training Food Security Risk Model...")
+        X_food, y_food, df_food = load_food_security_data(data_dir=self.data_dir)
+        self.food_model.train(X_food, y_food)
+        self._training_stats['food'] = {
+            'samples': len(y_food),
+            'class_distribution': dict(zip(*np.unique(y_food, return_counts=True)))
+        }
+        print(f"    Trained on {len(y_food)} samples")
+        
+        self._is_trained = True
+        
+        print("\n" + "=" * 60)
+        print("ALL MODELS TRAINED ON REAL DATA!")
+        print("=" * 60)
     
     def predict_environmental(
         self,
@@ -117,17 +107,7 @@ class RealDataRiskEngine:
     ) -> Dict:
         """Predict environmental risk from inputs."""
         X = np.array([[aqi, traffic_density, temperature, rainfall]])
-        result = self.env_model.predict_with_proba(X)
-        
-        return {
-            'risk_class': result['class'][0],
-            'probabilities': {
-                'low': float(result['probabilities']['low'][0]),
-                'medium': float(result['probabilities']['medium'][0]),
-                'high': float(result['probabilities']['high'][0])
-            },
-            'confidence': float(result['confidence'][0])
-        }
+        return self.env_model.predict_single(X)
     
     def predict_health(
         self,
@@ -141,17 +121,7 @@ class RealDataRiskEngine:
         X = np.array([[
             aqi, hospital_load, respiratory_cases, temperature, environmental_risk_prob
         ]])
-        result = self.health_model.predict_with_proba(X)
-        
-        return {
-            'risk_class': result['class'][0],
-            'probabilities': {
-                'low': float(result['probabilities']['low'][0]),
-                'medium': float(result['probabilities']['medium'][0]),
-                'high': float(result['probabilities']['high'][0])
-            },
-            'confidence': float(result['confidence'][0])
-        }
+        return self.health_model.predict_single(X)
     
     def predict_food_security(
         self,
@@ -165,17 +135,7 @@ class RealDataRiskEngine:
         X = np.array([[
             crop_supply_index, food_price_index, rainfall, temperature, supply_disruption_events
         ]])
-        result = self.food_model.predict_with_proba(X)
-        
-        return {
-            'risk_class': result['class'][0],
-            'probabilities': {
-                'low': float(result['probabilities']['low'][0]),
-                'medium': float(result['probabilities']['medium'][0]),
-                'high': float(result['probabilities']['high'][0])
-            },
-            'confidence': float(result['confidence'][0])
-        }
+        return self.food_model.predict_single(X)
     
     def get_training_stats(self) -> Dict:
         """Return training statistics for all models."""
@@ -106,18 +106,7 @@ class RiskEngine:
                  'confidence': 0.99
              }
              
-        result = self.env_model.predict_with_proba(X)
-        
-        # Convert to single-sample format
-        return {
-            'risk_class': result['class'][0],
-            'probabilities': {
-                'low': float(result['probabilities']['low'][0]),
-                'medium': float(result['probabilities']['medium'][0]),
-                'high': float(result['probabilities']['high'][0])
-            },
-            'confidence': float(result['confidence'][0])
-        }
+        return self.env_model.predict_single(X)
     
     def predict_health(
         self,
@@ -143,17 +132,7 @@ class RiskEngine:
         X = np.array([[
             aqi, hospital_load, respiratory_cases, temperature, environmental_risk_prob
         ]])
-        result = self.health_model.predict_with_proba(X)
-        
-        return {
-            'risk_class': result['class'][0],
-            'probabilities': {
-                'low': float(result['probabilities']['low'][0]),
-                'medium': float(result['probabilities']['medium'][0]),
-                'high': float(result['probabilities']['high'][0])
-            },
-            'confidence': float(result['confidence'][0])
-        }
+        return self.health_model.predict_single(X)
     
     def predict_food_security(
         self,
@@ -188,17 +167,7 @@ class RiskEngine:
                  'confidence': 0.99
              }
              
-        result = self.food_model.predict_with_proba(X)
-        
-        return {
-            'risk_class': result['class'][0],
-            'probabilities': {
-                'low': float(result['probabilities']['low'][0]),
-                'medium': float(result['probabilities']['medium'][0]),
-                'high': float(result['probabilities']['high'][0])
-            },
-            'confidence': float(result['confidence'][0])
-        }
+        return self.food_model.predict_single(X)
     
     def get_health_feature_importance(self) -> Dict:
         """Get feature importance from health model's RandomForest."""
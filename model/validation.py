@@ -380,10 +380,14 @@ class SystemValidator:
         results['brier_score'] = self._compute_brier_score()
         results['expected_calibration_error'] = self._compute_ece()
         
+        # Test the health model's NumPy forest against sklearn
+        results['fast_predictor_parity'] = self._check_fast_predictor_parity()
+        
         # Overall assessment
         results['calibration_verified'] = (
             results['probability_sum']['passed'] and
-            results['perturbation_stability']['stable']
+            results['perturbation_stability']['stable'] and
+            results['fast_predictor_parity']['passed']
         )
         
         return results
@@ -448,6 +452,31 @@ class SystemValidator:
             'threshold': 0.1
         }
     
+    def _check_fast_predictor_parity(self, tolerance: float = 1e-9) -> Dict:
+        """
+        Check HealthRiskModel's packed forest against sklearn's predict_proba
+        on rows the model was not trained on.
+        """
+        from .data_generators.health_data import generate_health_data
+        
+        model = self.engine.health_model
+        predictor = getattr(model, '_fast_predictor', None)
+        if predictor is None:
+            return {'passed': True, 'message': 'Fast predictor not in use'}
+        
+        # Training uses random_seed=42; a different seed gives held-out rows
+        X, _, _ = generate_health_data(n_samples=model.FAST_PREDICT_MAX_ROWS, random_seed=7)
+        fast = predictor.predict_proba(X)
+        reference = model.calibrated_model.predict_proba(X)
+        max_diff = float(np.abs(fast - reference).max())
+        
+        return {
+            'passed': max_diff <= tolerance,
+            'samples_tested': len(X),
+            'max_abs_difference': max_diff,
+            'tolerance': tolerance
+        }
+    
     def _compute_brier_score(self) -> Dict:
         """
         Compute Brier score for model calibration.